@@ -0,0 +1,95 @@
+"""Herramientas de estadistica descriptiva para datos grandes.
+
+Las funciones de este paquete recorren los datos por bloques, de modo que
+pueden aplicarse a listas, arreglos de NumPy, series de pandas o fuentes
+que no caben en memoria.
+"""
+
+from . import dispatch
+from .approx import approx_describe
+from .binning import Bins, cut
+from .bootstrap import BootstrapResult, bootstrap
+from .boxplot import (box_stats, boxplot, frame_box_stats, load_box_stats,
+                      save_box_stats)
+from .covariance import CovarianceAccumulator, covariance, covariance_parallel
+from .downsample import downsample
+from .figcache import CachedFigure, FigureCache
+from .frequency import FrequencyTable
+from .histogram import AdaptiveHistogram, Histogram, histogram
+from .kde import KDEResult, bandwidth, kde
+from .lazy import Summary
+from .mode import HeavyHitters, ModeResult, frequencies, mode, stream_mode
+from .moments import Moments, moments
+from .outliers import OutlierDetector, detect
+from .quantiles import QuantileSummary, five_number, quantiles
+from .raster import Raster, imshow, rasterize, shade
+from .rolling import RollingWindow, rolling
+from .sketch import ExactQuantiles, KLLSketch
+from .store import ColumnStore
+from .summation import CompensatedSum, compensated_sum, pairwise_sum
+from .summary import ColumnSummary, summarize, summarize_parallel
+from .trimmed import trim_mean, winsorized_mean
+from .weighted import (grouped_weighted_means, normalize_weights, weighted_gmean,
+                       weighted_hmean, weighted_mean)
+
+__all__ = [
+    "AdaptiveHistogram",
+    "Bins",
+    "BootstrapResult",
+    "CachedFigure",
+    "ColumnStore",
+    "ColumnSummary",
+    "CompensatedSum",
+    "CovarianceAccumulator",
+    "ExactQuantiles",
+    "FigureCache",
+    "FrequencyTable",
+    "HeavyHitters",
+    "Histogram",
+    "KDEResult",
+    "KLLSketch",
+    "ModeResult",
+    "OutlierDetector",
+    "Moments",
+    "QuantileSummary",
+    "Raster",
+    "RollingWindow",
+    "Summary",
+    "approx_describe",
+    "bandwidth",
+    "bootstrap",
+    "box_stats",
+    "boxplot",
+    "compensated_sum",
+    "covariance",
+    "covariance_parallel",
+    "cut",
+    "detect",
+    "dispatch",
+    "downsample",
+    "five_number",
+    "frame_box_stats",
+    "frequencies",
+    "grouped_weighted_means",
+    "histogram",
+    "imshow",
+    "kde",
+    "load_box_stats",
+    "mode",
+    "moments",
+    "normalize_weights",
+    "pairwise_sum",
+    "quantiles",
+    "rasterize",
+    "rolling",
+    "save_box_stats",
+    "shade",
+    "stream_mode",
+    "summarize",
+    "summarize_parallel",
+    "trim_mean",
+    "weighted_gmean",
+    "weighted_hmean",
+    "weighted_mean",
+    "winsorized_mean",
+]
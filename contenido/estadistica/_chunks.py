@@ -0,0 +1,76 @@
+"""Recorrido por bloques de las fuentes de datos."""
+
+from itertools import islice
+from numbers import Number
+
+import numpy as np
+
+# Numero de elementos por bloque cuando la fuente no trae su propia particion
+CHUNKSIZE = 1 << 16
+
+
+def iter_chunks(source, chunksize=CHUNKSIZE, dtype=None):
+    """Genera bloques 1-D de ``source`` sin cargar la fuente completa.
+
+    ``source`` puede ser un arreglo (incluido ``np.memmap``), una serie de
+    pandas, una lista, un iterable de escalares o un iterable de bloques.
+    Los arreglos se recorren con vistas, de modo que no se copian.
+    """
+    if hasattr(source, "to_numpy") and not isinstance(source, np.ndarray):
+        source = source.to_numpy()
+    if isinstance(source, (list, tuple)) and not _is_chunk_list(source):
+        source = np.asarray(source, dtype=dtype)
+    if isinstance(source, np.ndarray):
+        flat = source.reshape(-1)
+        for start in range(0, flat.size, chunksize):
+            chunk = flat[start:start + chunksize]
+            yield chunk if dtype is None else chunk.astype(dtype, copy=False)
+        return
+
+    iterator = iter(source)
+    first = next(iterator, _EMPTY)
+    if first is _EMPTY:
+        return
+    if isinstance(first, _SCALARS):
+        # Iterable de escalares (o de cadenas): se agrupan en bloques de
+        # tamaño fijo con el tipo nativo; las cadenas quedan como objetos
+        iterator = _prepend(first, iterator)
+        if dtype is None and isinstance(first, (str, bytes)):
+            dtype = object
+        while True:
+            items = list(islice(iterator, chunksize))
+            if not items:
+                return
+            yield np.asarray(items, dtype=dtype)
+    # Iterable de bloques: cada elemento es un bloque
+    for item in _prepend(first, iterator):
+        if hasattr(item, "to_numpy"):
+            item = item.to_numpy()
+        chunk = np.asarray(item, dtype=dtype).reshape(-1)
+        if chunk.size:
+            yield chunk
+
+
+def drop_nonfinite(chunk):
+    """``chunk`` sin ``NaN``, infinitos ni ``NaT``: los faltantes, que
+    ``DataFrame.describe()`` no cuenta, y los infinitos, que dejarian la
+    media y la varianza en ``NaN``."""
+    if chunk.dtype.kind in "fc":
+        return chunk[np.isfinite(chunk)]
+    if chunk.dtype.kind in "mM":
+        return chunk[~np.isnat(chunk)]
+    return chunk
+
+
+_EMPTY = object()
+
+_SCALARS = (Number, np.generic, str, bytes)
+
+
+def _is_chunk_list(source):
+    return len(source) > 0 and not isinstance(source[0], _SCALARS)
+
+
+def _prepend(first, iterator):
+    yield first
+    yield from iterator
@@ -0,0 +1,174 @@
+"""``describe()`` aproximado a partir de una muestra con intervalos de confianza.
+
+En lugar de recorrer todas las filas, se toma una muestra aleatoria de la
+fuente (un arreglo, ``np.memmap`` o columna de ``ColumnStore``) y cada
+estadistico se reporta con su intervalo de confianza. Una fuente por
+bloques (un iterable) no permite leer filas al azar: se recorre una vez y
+se guarda una muestra uniforme de a lo sumo ``max_sample`` datos
+(muestreo de reservorio), sobre la que luego crece la muestra.
+
+
+* media: aproximacion normal, s / sqrt(n);
+* desviacion estandar: metodo delta con el cuarto momento de la muestra;
+* cuartiles: intervalo de rangos (libre de distribucion) del binomial;
+* minimo y maximo: solo los valores de la muestra, sin intervalo.
+
+La muestra crece geometricamente hasta que el error relativo de todos los
+intervalos es menor que ``rel_error``. El error relativo se mide respecto a
+max(|estimacion|, desviacion estandar), para no exigir lo imposible cuando
+el estadistico es cercano a cero.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtri
+
+from ._chunks import CHUNKSIZE, _is_chunk_list, iter_chunks
+from .quantiles import quantiles
+
+PERCENTILES = (0.25, 0.5, 0.75)
+
+# Tamaño del reservorio para fuentes por bloques si no se da max_sample
+STREAM_SAMPLE = 1 << 20
+
+
+def approx_describe(source, rel_error=0.01, confidence=0.95, strata=1,
+                    initial=10_000, growth=4, max_sample=None, seed=None,
+                    chunksize=CHUNKSIZE):
+    """Resumen aproximado de ``source`` con intervalos de confianza.
+
+    ``strata`` divide la fuente en bloques contiguos del mismo tamaño y
+    toma la misma cantidad de datos de cada uno (muestreo estratificado),
+    lo que protege contra tendencias en el orden de los datos. Retorna un
+    ``DataFrame`` con las columnas ``estimate``, ``low`` y ``high``; el
+    tamaño final de la muestra queda en ``.attrs["sample_size"]``.
+
+    Si ``source`` es un iterable de bloques o de escalares, se recorre una
+    vez para tomar una muestra uniforme de ``max_sample`` datos (por
+    defecto ``STREAM_SAMPLE``); ``strata`` solo se admite con arreglos.
+    """
+    if hasattr(source, "to_numpy"):
+        source = source.to_numpy()
+    rng = np.random.default_rng(seed)
+    streamed = not (isinstance(source, np.ndarray) or (
+        isinstance(source, (list, tuple)) and not _is_chunk_list(source)))
+    if streamed:
+        if strata != 1:
+            raise ValueError("el muestreo estratificado necesita un arreglo o "
+                             "np.memmap, no una fuente por bloques")
+        cap = STREAM_SAMPLE if max_sample is None else max_sample
+        # Reservorio en orden aleatorio: cada prefijo es una muestra uniforme
+        data, total = _reservoir(source, cap, rng, chunksize)
+    else:
+        data = np.asarray(source).reshape(-1)
+        total = data.size
+    if total == 0:
+        raise ValueError("la fuente esta vacia")
+    # Con una fuente por bloques data es el reservorio, no todos los datos
+    limit = min(total if max_sample is None else max_sample, data.size)
+    z = float(ndtri(0.5 + confidence / 2))
+
+    size = min(initial, limit)
+    sample = np.empty(0)
+    while True:
+        if 2 * size >= limit:
+            # Muestrear casi todo lo permitido no ahorra nada: se toma el
+            # limite, que son todos los datos si no hay max_sample
+            size = limit
+        if size == total:
+            sample = np.asarray(data, dtype=np.float64)
+        elif streamed:
+            sample = data[:size]
+        else:
+            extra = _draw(data, size - sample.size, strata, rng)
+            sample = np.concatenate((sample, extra))
+        table = _describe_sample(sample, total, z, exact=size == total)
+        if size >= limit or _relative_error(table) <= rel_error:
+            break
+        size = min(size * growth, limit)
+    table.attrs.pop("std")
+    table.attrs["sample_size"] = size
+    return table
+
+
+def _reservoir(source, size, rng, chunksize):
+    """Muestra uniforme de a lo sumo ``size`` datos de ``source``, en orden
+    aleatorio, y numero total de datos, en una pasada por bloques.
+
+    Cada dato recibe una clave aleatoria y se conservan las ``size`` claves
+    menores; una vez lleno el reservorio solo se miran los datos con clave
+    menor que la mayor conservada.
+    """
+    kept, keys, total = np.empty(0), np.empty(0), 0
+    for chunk in iter_chunks(source, chunksize, dtype=np.float64):
+        total += chunk.size
+        chunk_keys = rng.random(chunk.size)
+        if kept.size == size:
+            new = chunk_keys < keys.max()
+            chunk, chunk_keys = chunk[new], chunk_keys[new]
+        kept = np.concatenate((kept, chunk))
+        keys = np.concatenate((keys, chunk_keys))
+        if kept.size > size:
+            top = np.argpartition(keys, size - 1)[:size]
+            kept, keys = kept[top], keys[top]
+    return kept[np.argsort(keys)], total
+
+
+def _draw(data, size, strata, rng):
+    total = data.size
+    strata = max(1, min(int(strata), size))
+    bounds = np.linspace(0, total, strata + 1).astype(np.int64)
+    per = np.full(strata, size // strata)
+    per[:size % strata] += 1
+    idx = np.concatenate([rng.integers(lo, hi, size=k)
+                          for lo, hi, k in zip(bounds[:-1], bounds[1:], per)])
+    # Indices ordenados: lectura secuencial del archivo mapeado
+    idx.sort()
+    return np.asarray(data[idx], dtype=np.float64)
+
+
+def _describe_sample(x, total, z, exact):
+    n = x.size
+    result = quantiles(x, PERCENTILES)
+    mean = x.mean()
+    dev = x - mean
+    m2 = np.dot(dev, dev) / n
+    std = np.sqrt(m2 * n / (n - 1)) if n > 1 else np.nan
+
+    rows = {"count": (total, total, total)}
+    if exact:
+        rows["mean"] = (mean,) * 3
+        rows["std"] = (std,) * 3
+    else:
+        se_mean = std / np.sqrt(n)
+        m4 = np.mean(dev ** 4)
+        se_std = np.sqrt(max(m4 - m2 * m2, 0.0) / n) / (2 * std) if std > 0 else 0.0
+        rows["mean"] = (mean, mean - z * se_mean, mean + z * se_mean)
+        rows["std"] = (std, std - z * se_std, std + z * se_std)
+    rows["min"] = (result.min, np.nan, np.nan) if not exact else (result.min,) * 3
+
+    ordered = None if exact else np.sort(x)
+    for q, value in zip(PERCENTILES, result.quantiles):
+        label = "{:g}%".format(100 * q)
+        if exact:
+            rows[label] = (value,) * 3
+            continue
+        half = z * np.sqrt(n * q * (1 - q))
+        lo = int(np.clip(np.floor(n * q - half), 0, n - 1))
+        hi = int(np.clip(np.ceil(n * q + half), 0, n - 1))
+        rows[label] = (value, ordered[lo], ordered[hi])
+    rows["max"] = (result.max, np.nan, np.nan) if not exact else (result.max,) * 3
+
+    table = pd.DataFrame.from_dict(rows, orient="index",
+                                   columns=["estimate", "low", "high"])
+    table.attrs["std"] = std
+    return table.astype(np.float64)
+
+
+def _relative_error(table):
+    bounded = table.dropna()
+    scale = np.maximum(bounded["estimate"].abs(), table.attrs["std"])
+    half = (bounded["high"] - bounded["low"]) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rel = (half / scale).fillna(0.0)
+    return float(rel.max())
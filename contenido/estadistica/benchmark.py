@@ -0,0 +1,200 @@
+"""Comparacion de tiempos de las medidas de localizacion y dispersion.
+
+Mide cada implementacion (Python puro, NumPy, pandas y las del paquete)
+sobre varios tamaños, tipos de dato y disposiciones en memoria (contigua,
+con saltos o mapeada a disco). Guarda el mejor tiempo y el pico de memoria
+de cada caso en JSON, para comparar resultados entre commits::
+
+    python -m estadistica.benchmark --sizes 10 1000 100000 -o nuevo.json
+    python -m estadistica.benchmark --compare base.json nuevo.json
+
+Para tamaños muy grandes (hasta 10^9) conviene ``--layouts memmap`` y
+``--dir`` en un disco con espacio suficiente.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from .moments import moments
+from .quantiles import quantiles
+
+DTYPES = ("float64", "float32", "int64")
+LAYOUTS = ("contiguous", "strided", "memmap")
+DEFAULT_SIZES = (10, 1_000, 100_000, 10_000_000)
+
+# Las implementaciones que recorren o crean listas de Python del tamaño de
+# los datos (``PURE_PYTHON``) se omiten por encima de este tamaño
+MAX_PYTHON = 10_000_000
+
+
+def media(data):
+    return sum(data) / len(data)
+
+
+def manual_var(data):
+    mean = np.mean(data)
+    dev = data - np.array(data.size * [mean])
+    return np.sum(dev ** 2) / (data.size - 1)
+
+
+# nombre: (funcion, preparacion de la entrada)
+IMPLEMENTATIONS = {
+    "media": (media, lambda x: x.tolist()),
+    "np.mean": (np.mean, None),
+    "pd.DataFrame.mean": (lambda df: df.mean(), lambda x: pd.DataFrame({"x": x})),
+    "manual_var": (manual_var, None),
+    "np.var(ddof=1)": (lambda x: np.var(x, ddof=1), None),
+    "moments": (lambda x: moments(x).var(1), None),
+    "np.quantile x5": (lambda x: [np.quantile(x, q) for q in (0, .25, .5, .75, 1)], None),
+    "quantiles": (lambda x: quantiles(x, (0, .25, .5, .75, 1)), None),
+}
+
+# media convierte los datos a lista y manual_var crea una lista de n medias
+PURE_PYTHON = frozenset({"media", "manual_var"})
+
+
+def make_data(size, dtype, layout, directory=None, seed=0):
+    """Arreglo de prueba con la disposicion ``layout``."""
+    rng = np.random.default_rng(seed)
+    if layout == "memmap":
+        with tempfile.NamedTemporaryFile(suffix=".bin", dir=directory,
+                                         delete=False) as f:
+            path = f.name
+        data = np.memmap(path, dtype=dtype, mode="w+", shape=(size,))
+        for start in range(0, size, 1 << 20):
+            stop = min(start + (1 << 20), size)
+            data[start:stop] = _random(rng, stop - start, dtype)
+        data.flush()
+        return np.memmap(path, dtype=dtype, mode="r", shape=(size,))
+    if layout == "strided":
+        return _random(rng, 2 * size, dtype)[::2]
+    return _random(rng, size, dtype)
+
+
+def _random(rng, size, dtype):
+    if np.dtype(dtype).kind == "i":
+        return rng.integers(0, 1000, size=size, dtype=dtype)
+    return rng.normal(100.0, 15.0, size=size).astype(dtype)
+
+
+def _measure(func, data, repeat):
+    number = 1
+    timer = timeit.Timer(lambda: func(data))
+    while number < 1_000_000 and timer.timeit(number) < 0.05:
+        number *= 10
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    tracemalloc.start()
+    func(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(sizes=DEFAULT_SIZES, dtypes=DTYPES, layouts=LAYOUTS, names=None,
+        repeat=5, directory=None, log=None):
+    """Ejecuta los casos y retorna una lista de resultados."""
+    results = []
+    for size in sizes:
+        for dtype in dtypes:
+            for layout in layouts:
+                data = make_data(size, dtype, layout, directory)
+                for name in names or IMPLEMENTATIONS:
+                    func, prepare = IMPLEMENTATIONS[name]
+                    if name in PURE_PYTHON and size > MAX_PYTHON:
+                        continue
+                    arg = data if prepare is None else prepare(data)
+                    seconds, peak = _measure(func, arg, repeat)
+                    row = {"name": name, "size": size, "dtype": dtype,
+                           "layout": layout, "seconds": seconds,
+                           "peak_bytes": peak}
+                    results.append(row)
+                    if log:
+                        print("{name:>20} n={size:<11} {dtype:<8} {layout:<10} "
+                              "{seconds:.3e} s  {peak_bytes} B".format(**row),
+                              file=log)
+                if isinstance(data, np.memmap):
+                    path = data.filename
+                    del data
+                    os.remove(path)
+    return results
+
+
+def metadata():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def compare(base, new, tolerance=0.10):
+    """Tabla con la razon de tiempos nuevo/base de los casos comunes.
+
+    La columna ``regression`` marca los casos mas lentos que la base en mas
+    de ``tolerance`` (10% por defecto).
+    """
+    key = ["name", "size", "dtype", "layout"]
+    a = pd.DataFrame(base["results"]).set_index(key)
+    b = pd.DataFrame(new["results"]).set_index(key)
+    table = a.join(b, lsuffix="_base", rsuffix="_new", how="inner")
+    table["ratio"] = table["seconds_new"] / table["seconds_base"]
+    table["regression"] = table["ratio"] > 1 + tolerance
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--dtypes", nargs="+", default=DTYPES, choices=DTYPES)
+    parser.add_argument("--layouts", nargs="+", default=LAYOUTS, choices=LAYOUTS)
+    parser.add_argument("--names", nargs="+", choices=list(IMPLEMENTATIONS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--dir", help="directorio para los archivos mapeados")
+    parser.add_argument("-o", "--output", help="archivo JSON de resultados")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NUEVO"))
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            base = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+        table = compare(base, new, args.tolerance)
+        print(table[["seconds_base", "seconds_new", "ratio", "regression"]]
+              .to_string())
+        return 1 if table["regression"].any() else 0
+
+    results = run(args.sizes, args.dtypes, args.layouts, args.names,
+                  args.repeat, args.dir, log=sys.stderr)
+    report = {"metadata": metadata(), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
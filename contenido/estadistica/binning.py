@@ -0,0 +1,81 @@
+"""Clasificacion de datos en intervalos sin ``pd.cut``.
+
+``pd.cut`` crea un ``Categorical`` de objetos ``Interval``; aqui cada dato
+recibe solo un codigo entero compacto (``uint8`` o ``uint16`` segun el
+numero de intervalos) calculado con ``np.searchsorted``. Las etiquetas de
+pandas se construyen unicamente para mostrar los conteos.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class Bins:
+    """Intervalos definidos por ``edges`` crecientes.
+
+    ``closed="right"`` da intervalos (a, b], como ``pd.cut`` por defecto, y
+    ``closed="left"`` da [a, b). Con ``include_lowest`` el primer intervalo
+    incluye tambien su borde izquierdo, como en ``pd.cut``.
+    """
+
+    def __init__(self, edges, closed="right", include_lowest=False):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        if self.edges.ndim != 1 or self.edges.size < 2 or np.any(np.diff(self.edges) <= 0):
+            raise ValueError("los bordes deben ser crecientes")
+        if closed not in ("right", "left"):
+            raise ValueError("closed debe ser 'right' o 'left'")
+        self.closed = closed
+        self.include_lowest = include_lowest
+        nbins = self.edges.size - 1
+        # El mayor codigo se reserva para los datos fuera de los intervalos
+        self.dtype = np.uint8 if nbins < np.iinfo(np.uint8).max else (
+            np.uint16 if nbins < np.iinfo(np.uint16).max else np.uint32)
+        self.missing = np.iinfo(self.dtype).max
+
+    @classmethod
+    def from_intervals(cls, intervals):
+        """Convierte un ``pd.IntervalIndex`` contiguo."""
+        intervals = pd.IntervalIndex(intervals)
+        if not np.array_equal(intervals.left[1:], intervals.right[:-1]):
+            raise ValueError("los intervalos deben ser contiguos")
+        edges = np.append(intervals.left, intervals.right[-1])
+        return cls(edges, closed=intervals.closed)
+
+    @property
+    def nbins(self):
+        return self.edges.size - 1
+
+    def codes(self, data):
+        """Codigo del intervalo de cada dato; ``missing`` si no cae en
+        ninguno (o es NaN)."""
+        x = np.asarray(data, dtype=np.float64).reshape(-1)
+        side = "left" if self.closed == "right" else "right"
+        idx = np.searchsorted(self.edges, x, side=side) - 1
+        if self.closed == "right" and self.include_lowest:
+            idx[x == self.edges[0]] = 0
+        outside = (idx < 0) | (idx >= self.nbins) | np.isnan(x)
+        idx[outside] = self.missing
+        return idx.astype(self.dtype)
+
+    def counts(self, data):
+        """Numero de datos en cada intervalo."""
+        codes = self.codes(data)
+        return np.bincount(codes[codes != self.missing], minlength=self.nbins)
+
+    def labels(self):
+        """``pd.IntervalIndex`` de los intervalos, solo para mostrar."""
+        return pd.IntervalIndex.from_breaks(self.edges, closed=self.closed)
+
+    def value_counts(self, data):
+        """Conteos con etiquetas de intervalo, como ``pd.cut(...).value_counts()``
+        ordenado por intervalo."""
+        return pd.Series(self.counts(data), index=self.labels(), name="count")
+
+
+def cut(data, edges, closed="right", include_lowest=False):
+    """Codigos enteros de ``data`` en los intervalos de ``edges``.
+
+    >>> cut([1280, 5320, 4390, 360, 100], [0, 1000, 2000, 3000, 4000, 5000, 6000])
+    array([1, 5, 4, 0, 0], dtype=uint8)
+    """
+    return Bins(edges, closed, include_lowest).codes(data)
@@ -0,0 +1,151 @@
+"""Diagramas de caja dibujados a partir de estadisticos ya calculados.
+
+``ax.boxplot(data)`` y ``sns.boxplot`` reciben el arreglo completo y lo
+vuelven a ordenar en cada dibujo. Aqui los estadisticos de la caja se
+calculan una sola vez, exactos (con un solo ``np.partition``) o con un
+``KLLSketch`` si los datos llegan por bloques, y se dibujan con
+``Axes.bxp``. Los atipicos se guardan como una muestra de tamaño limitado.
+
+Los estadisticos son diccionarios con el formato de ``Axes.bxp``; se pueden
+guardar con ``save_box_stats`` y volver a dibujar sin tocar los datos.
+
+>>> stats = box_stats([40, 52, 55, 60, 70, 75, 85, 85, 90, 90, 92, 94, 94, 95, 98, 100, 115, 125, 125])
+>>> float(stats["q1"]), float(stats["med"]), float(stats["q3"]), float(stats["whislo"])
+(72.5, 90.0, 96.5, 40.0)
+"""
+
+import json
+
+import numpy as np
+
+from ._chunks import CHUNKSIZE, iter_chunks
+from .lazy import _reiterable
+from .outliers import OutlierDetector
+from .quantiles import quantiles
+
+# Claves de ``Axes.bxp`` que son numeros (``fliers`` es un arreglo)
+_SCALARS = ("mean", "med", "q1", "q3", "iqr", "cilo", "cihi", "whislo", "whishi")
+
+
+def box_stats(data, whis=1.5, label=None, exact=True, max_fliers=1000,
+              chunksize=CHUNKSIZE, seed=None):
+    """Estadisticos de la caja de ``data`` en el formato de ``Axes.bxp``.
+
+    Con ``exact=True`` los cuartiles y los bigotes coinciden con los de
+    ``ax.boxplot``. Con ``exact=False`` ``data`` se recorre por bloques y
+    los cuartiles salen de un ``KLLSketch``. En ambos casos ``fliers`` es
+    una muestra de a lo sumo ``max_fliers`` atipicos y ``n_fliers`` el
+    numero total de atipicos.
+
+    Por bloques, si ``data`` puede recorrerse dos veces, una segunda
+    pasada cuenta y muestrea los atipicos respecto a los bigotes finales.
+    Si no, ``n_fliers`` es la estimacion de ``OutlierDetector`` y
+    ``n_fliers_exact`` queda en ``False``.
+    """
+    if not exact:
+        detector = OutlierDetector(whis, max_fliers=max_fliers, seed=seed)
+        for chunk in iter_chunks(data, chunksize, dtype=np.float64):
+            detector.update(chunk[~np.isnan(chunk)])
+        stats = detector.whisker_stats(label)
+        if _reiterable(data):
+            stats["fliers"], stats["n_fliers"] = _sample_fliers(
+                data, stats["whislo"], stats["whishi"], max_fliers, chunksize, seed)
+            stats["n_fliers_exact"] = True
+        else:
+            stats["n_fliers"] = detector.n_outliers
+            stats["n_fliers_exact"] = False
+        return stats
+
+    x = np.asarray(data, dtype=np.float64).reshape(-1)
+    x = x[~np.isnan(x)]
+    q1, med, q3 = quantiles(x, [0.25, 0.5, 0.75]).quantiles
+    iqr = q3 - q1
+    lo, hi = q1 - whis * iqr, q3 + whis * iqr
+    # Como en matplotlib, el bigote no puede quedar dentro de la caja
+    whislo = min(q1, x[x >= lo].min())
+    whishi = max(q3, x[x <= hi].max())
+    fliers = x[(x < whislo) | (x > whishi)]
+    n_fliers = fliers.size
+    if n_fliers > max_fliers:
+        fliers = np.random.default_rng(seed).choice(fliers, max_fliers,
+                                                    replace=False)
+    stats = {
+        "mean": x.mean(),
+        "med": med,
+        "q1": q1,
+        "q3": q3,
+        "iqr": iqr,
+        "cilo": med - 1.57 * iqr / np.sqrt(x.size),
+        "cihi": med + 1.57 * iqr / np.sqrt(x.size),
+        "whislo": whislo,
+        "whishi": whishi,
+        "fliers": np.sort(fliers),
+        "n_fliers": n_fliers,
+        "n_fliers_exact": True,
+    }
+    if label is not None:
+        stats["label"] = label
+    return stats
+
+
+def _sample_fliers(data, whislo, whishi, max_fliers, chunksize, seed):
+    """Muestra uniforme de a lo sumo ``max_fliers`` valores fuera de los
+    bigotes y numero total de ellos, en una pasada por bloques."""
+    rng = np.random.default_rng(seed)
+    kept, keys, count = np.empty(0), np.empty(0), 0
+    for chunk in iter_chunks(data, chunksize, dtype=np.float64):
+        out = chunk[(chunk < whislo) | (chunk > whishi)]
+        if out.size == 0:
+            continue
+        count += out.size
+        kept = np.concatenate((kept, out))
+        keys = np.concatenate((keys, rng.random(out.size)))
+        if kept.size > max_fliers:
+            top = np.argpartition(-keys, max_fliers - 1)[:max_fliers]
+            kept, keys = kept[top], keys[top]
+    return np.sort(kept), count
+
+
+def frame_box_stats(frame, **options):
+    """Lista con los estadisticos de cada columna de ``frame``, etiquetados
+    con el nombre de la columna."""
+    return [box_stats(frame[name].to_numpy(), label=name, **options)
+            for name in frame.columns]
+
+
+def boxplot(stats, ax=None, **kwargs):
+    """Dibuja uno o varios estadisticos de caja con ``Axes.bxp``.
+
+    ``kwargs`` se pasan a ``Axes.bxp`` (``orientation``, ``showmeans``,
+    ``boxprops``...). Retorna el diccionario de artistas de ``bxp``.
+    """
+    if ax is None:
+        import matplotlib.pyplot as plt
+        ax = plt.gca()
+    if isinstance(stats, dict):
+        stats = [stats]
+    return ax.bxp(stats, **kwargs)
+
+
+def save_box_stats(stats, path):
+    """Guarda una lista de estadisticos de caja en JSON."""
+    records = []
+    for s in stats:
+        record = {key: float(s[key]) for key in _SCALARS}
+        record["fliers"] = np.asarray(s["fliers"], dtype=np.float64).tolist()
+        record["n_fliers"] = int(s.get("n_fliers", len(s["fliers"])))
+        record["n_fliers_exact"] = bool(s.get("n_fliers_exact", True))
+        if "label" in s:
+            record["label"] = s["label"]
+        records.append(record)
+    with open(path, "w") as f:
+        json.dump(records, f)
+
+
+def load_box_stats(path):
+    """Lee estadisticos guardados con ``save_box_stats``."""
+    with open(path) as f:
+        records = json.load(f)
+    for record in records:
+        record["fliers"] = np.asarray(record["fliers"])
+    return records
@@ -0,0 +1,138 @@
+"""Matrices de covarianza y correlacion en una sola pasada por filas.
+
+El acumulador guarda el vector de medias y la matriz de co-momentos
+C = sum((x - media)(x - media)^T); cada bloque de filas se combina con la
+version multivariada de la actualizacion de Chan et al. y los resultados
+parciales de varios procesos se combinan con ``merge``.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+
+import numpy as np
+import pandas as pd
+
+# Filas por bloque al recorrer arreglos grandes
+ROW_CHUNKSIZE = 4096
+
+# Columnas por bloque al calcular el producto X^T X
+COLUMN_BLOCK = 512
+
+
+class CovarianceAccumulator:
+    """Conteo, medias y co-momentos de un conjunto de columnas."""
+
+    def __init__(self, columns=None, block=COLUMN_BLOCK):
+        self.columns = None if columns is None else list(columns)
+        self.block = int(block)
+        self.count = 0
+        self.mean = None
+        self.comoment = None
+
+    def update(self, rows):
+        """Agrega un bloque de filas (arreglo 2-D o ``DataFrame``)."""
+        if isinstance(rows, pd.DataFrame):
+            if self.columns is None:
+                self.columns = list(rows.columns)
+            rows = rows.to_numpy()
+        x = np.asarray(rows, dtype=np.float64)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        if x.shape[0] == 0:
+            return self
+        mean = x.mean(axis=0)
+        dev = x - mean
+        self._combine(x.shape[0], mean, _blocked_gram(dev, self.block))
+        return self
+
+    def merge(self, other):
+        """Combina dos acumuladores y retorna uno nuevo."""
+        result = CovarianceAccumulator(self.columns or other.columns, self.block)
+        result.count = self.count
+        if self.count:
+            result.mean = self.mean.copy()
+            result.comoment = self.comoment.copy()
+        if other.count:
+            result._combine(other.count, other.mean, other.comoment)
+        return result
+
+    def _combine(self, count, mean, comoment):
+        if self.count == 0:
+            self.count = count
+            self.mean = np.array(mean, dtype=np.float64)
+            self.comoment = np.array(comoment, dtype=np.float64)
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.comoment += comoment
+        self.comoment += np.outer(delta, delta) * (self.count * count / total)
+        self.mean += delta * (count / total)
+        self.count = total
+
+    def cov(self, ddof=1):
+        """Matriz de covarianza, como ``DataFrame.cov()``."""
+        if self.count - ddof <= 0:
+            raise ValueError("no hay suficientes filas")
+        return self._frame(self.comoment / (self.count - ddof))
+
+    def corr(self):
+        """Matriz de correlacion de Pearson, como ``DataFrame.corr()``."""
+        std = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = self.comoment / np.outer(std, std)
+        np.fill_diagonal(corr, np.where(std > 0, 1.0, np.nan))
+        return self._frame(np.clip(corr, -1.0, 1.0))
+
+    def _frame(self, matrix):
+        if self.columns is None:
+            return matrix
+        return pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+
+
+def _blocked_gram(dev, block):
+    """Producto dev^T dev calculado por bloques de columnas.
+
+    Solo se calculan los bloques del triangulo superior; el resto se copia
+    por simetria.
+    """
+    p = dev.shape[1]
+    if p <= block:
+        return dev.T @ dev
+    out = np.empty((p, p))
+    for i in range(0, p, block):
+        left = dev[:, i:i + block]
+        for j in range(i, p, block):
+            out[i:i + block, j:j + block] = left.T @ dev[:, j:j + block]
+            if j != i:
+                out[j:j + block, i:i + block] = out[i:i + block, j:j + block].T
+    return out
+
+
+def iter_row_chunks(source, chunksize=ROW_CHUNKSIZE):
+    """Bloques de filas de un arreglo 2-D, ``DataFrame`` o iterable de bloques."""
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize]
+    elif isinstance(source, np.ndarray):
+        for start in range(0, source.shape[0], chunksize):
+            yield source[start:start + chunksize]
+    else:
+        yield from source
+
+
+def covariance(source, chunksize=ROW_CHUNKSIZE, block=COLUMN_BLOCK):
+    """Acumula ``source`` por bloques de filas; ver ``CovarianceAccumulator``."""
+    acc = CovarianceAccumulator(block=block)
+    for rows in iter_row_chunks(source, chunksize):
+        acc.update(rows)
+    return acc
+
+
+def covariance_parallel(partitions, max_workers=None, chunksize=ROW_CHUNKSIZE,
+                        block=COLUMN_BLOCK):
+    """Acumula cada particion en un proceso y combina los resultados."""
+    work = partial(covariance, chunksize=chunksize, block=block)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        parts = list(pool.map(work, partitions))
+    return reduce(CovarianceAccumulator.merge, parts,
+                  CovarianceAccumulator(block=block))
@@ -0,0 +1,255 @@
+"""Seleccion automatica de la implementacion segun el tipo y tamaño de datos.
+
+Los notebooks muestran cada calculo tres veces: Python puro (``media``),
+NumPy y pandas. Cada uno es el mas rapido en un rango distinto: con
+listas cortas convertir a ``np.array`` cuesta mas que el calculo, y con
+listas largas el ciclo de Python es lento. Las funciones de este modulo
+eligen el camino segun la entrada:
+
+* ``pandas``: series y ``DataFrame`` (se usan sus metodos, sin convertir);
+* ``python``: listas o tuplas mas cortas que el umbral del estadistico y
+  arreglos de objetos;
+* ``numpy``: arreglos y listas largas;
+* ``stream``: ``np.memmap`` e iterables, recorridos por bloques. La
+  mediana de un ``np.memmap`` es exacta (seleccion en varias pasadas); la
+  de un iterable, que solo se recorre una vez, es aproximada (``KLLSketch``).
+
+Los umbrales por defecto se pueden reemplazar con los medidos en la
+maquina con ``calibrate()``. El camino elegido se registra en el logger
+``estadistica.dispatch`` con nivel DEBUG.
+"""
+
+import json
+import logging
+import math
+import os
+import statistics
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from ._chunks import CHUNKSIZE, iter_chunks
+from .moments import moments
+from .sketch import KLLSketch
+from .summary import summarize
+
+logger = logging.getLogger(__name__)
+
+# Longitud de lista a partir de la cual NumPy es mas rapido que Python puro
+DEFAULT_THRESHOLDS = {"mean": 64, "var": 32, "median": 512}
+
+CALIBRATION_FILE = os.environ.get(
+    "ESTADISTICA_DISPATCH",
+    os.path.join(os.path.expanduser("~"), ".cache", "estadistica", "dispatch.json"))
+
+_thresholds = None
+
+
+def thresholds():
+    """Umbrales vigentes: los calibrados si existen, si no los de defecto."""
+    global _thresholds
+    if _thresholds is None:
+        _thresholds = dict(DEFAULT_THRESHOLDS)
+        if os.path.exists(CALIBRATION_FILE):
+            with open(CALIBRATION_FILE) as f:
+                _thresholds.update(json.load(f))
+    return _thresholds
+
+
+def choose_backend(data, stat):
+    """Nombre del camino que se usara para ``stat`` sobre ``data``.
+
+    Los arreglos de objetos (``Decimal``, ``Fraction``...) van por el
+    camino de Python: NumPy no los vectoriza y ``math.fsum`` suma sin
+    perder precision.
+    """
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        return "pandas"
+    if isinstance(data, np.memmap):
+        return "stream"
+    if isinstance(data, np.ndarray):
+        return "python" if data.dtype.hasobject else "numpy"
+    if isinstance(data, (list, tuple)):
+        return "python" if len(data) < thresholds()[stat] else "numpy"
+    return "stream"
+
+
+# Los caminos en Python puro dan los mismos resultados que NumPy: NaN si
+# no hay datos suficientes y siempre un float
+def _python_mean(x):
+    return math.fsum(x) / len(x) if len(x) else math.nan
+
+
+def _python_var(x, ddof):
+    if len(x) - ddof <= 0:
+        return math.nan
+    m = _python_mean(x)
+    return math.fsum((v - m) ** 2 for v in x) / (len(x) - ddof)
+
+
+def _python_median(x):
+    return float(statistics.median(x)) if len(x) else math.nan
+
+
+# Candidatos que se cargan en memoria al final de la seleccion por bloques
+_SELECT_LIMIT = 1 << 20
+_SELECT_BINS = 1024
+
+
+def _stream_select(x, k, chunksize=CHUNKSIZE):
+    """Valor de rango ``k`` (base 0) de ``x`` sin cargarlo completo.
+
+    Cada pasada cuenta por bloques cuantos datos caen en cada subintervalo
+    del intervalo que contiene al rango ``k`` y se queda con ese
+    subintervalo; cuando quedan pocos candidatos se cargan y se usa
+    ``np.partition``. El intervalo es [lo, hi), o [lo, hi] si ``closed``.
+    """
+    lo, hi = np.inf, -np.inf
+    for chunk in iter_chunks(x, chunksize, dtype=np.float64):
+        lo, hi = min(lo, chunk.min()), max(hi, chunk.max())
+    closed, rank, size = True, k, x.size
+    while True:
+        def candidates(chunk):
+            keep = (chunk >= lo) & ((chunk < hi) | (closed & (chunk == hi)))
+            return chunk[keep]
+        if lo == hi:
+            return float(lo)
+        if np.nextafter(lo, np.inf) == hi:
+            # El intervalo ya no se puede dividir: los candidatos valen lo
+            # (o hi si el intervalo es cerrado), como con muchos repetidos
+            if not closed:
+                return float(lo)
+            below = sum(int(np.count_nonzero(c == lo)) for c in
+                        iter_chunks(x, chunksize, dtype=np.float64))
+            return float(lo if rank < below else hi)
+        if size <= _SELECT_LIMIT:
+            values = np.concatenate([candidates(c) for c in
+                                     iter_chunks(x, chunksize, dtype=np.float64)])
+            return float(np.partition(values, rank)[rank])
+        edges = np.unique(np.linspace(lo, hi, _SELECT_BINS + 1))
+        if edges.size == 2:
+            # Quedan pocos valores representables en [lo, hi]: se separa lo
+            # para que cada pasada reduzca el intervalo
+            edges = np.array([lo, np.nextafter(lo, np.inf), hi])
+        counts = np.zeros(edges.size - 1, dtype=np.int64)
+        low, high = np.inf, -np.inf
+        for chunk in iter_chunks(x, chunksize, dtype=np.float64):
+            c = candidates(chunk)
+            if c.size:
+                low, high = min(low, c.min()), max(high, c.max())
+            idx = np.minimum(np.searchsorted(edges, c, side="right") - 1,
+                             counts.size - 1)
+            counts += np.bincount(idx, minlength=counts.size)
+        if low == high:
+            # Todos los candidatos son iguales (datos muy repetidos)
+            return float(low)
+        cum = np.cumsum(counts)
+        b = int(np.searchsorted(cum, rank, side="right"))
+        if b:
+            rank -= int(cum[b - 1])
+        size = int(counts[b])
+        closed = closed and b == counts.size - 1
+        # El subintervalo se ajusta al menor y mayor candidato vistos
+        lo, hi = max(edges[b], low), edges[b + 1]
+        if high < hi:
+            hi, closed = high, True
+
+
+def _stream_median(x):
+    """Mediana exacta de un ``np.memmap`` recorriendolo por bloques."""
+    n = x.size
+    if n == 0:
+        return math.nan
+    for chunk in iter_chunks(x, dtype=np.float64):
+        if np.isnan(chunk).any():
+            return math.nan
+    high = _stream_select(x, n // 2)
+    if n % 2:
+        return high
+    return (_stream_select(x, n // 2 - 1) + high) / 2
+
+
+_IMPLEMENTATIONS = {
+    "mean": {
+        "python": lambda x, **kw: _python_mean(x),
+        "numpy": lambda x, **kw: float(np.mean(x)),
+        "pandas": lambda x, **kw: x.mean(),
+        "stream": lambda x, **kw: float(moments(x).mean),
+    },
+    "var": {
+        "python": lambda x, ddof: _python_var(x, ddof),
+        "numpy": lambda x, ddof: float(np.var(x, ddof=ddof)),
+        "pandas": lambda x, ddof: x.var(ddof=ddof),
+        "stream": lambda x, ddof: float(moments(x).var(ddof)),
+    },
+    "median": {
+        "python": lambda x, **kw: _python_median(x),
+        "numpy": lambda x, **kw: float(np.median(x)),
+        "pandas": lambda x, **kw: x.median(),
+        # np.memmap: seleccion exacta por bloques; iterables: aproximada con KLL
+        "stream": lambda x, **kw: (
+            _stream_median(x) if isinstance(x, np.ndarray)
+            else float(summarize(x, sketch=KLLSketch).quantile(0.5))),
+    },
+}
+
+
+def _dispatch(stat, data, **kwargs):
+    backend = choose_backend(data, stat)
+    logger.debug("%s: camino %s (%s)", stat, backend, type(data).__name__)
+    return _IMPLEMENTATIONS[stat][backend](data, **kwargs)
+
+
+def mean(data):
+    """Media con la implementacion mas rapida para ``data``."""
+    return _dispatch("mean", data)
+
+
+def var(data, ddof=1):
+    """Varianza (muestral por defecto) con la implementacion mas rapida."""
+    return _dispatch("var", data, ddof=ddof)
+
+
+def std(data, ddof=1):
+    """Desviacion estandar (muestral por defecto)."""
+    return var(data, ddof) ** 0.5
+
+
+def median(data):
+    """Mediana con la implementacion mas rapida para ``data``."""
+    return _dispatch("median", data)
+
+
+def calibrate(sizes=(8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096),
+              repeat=5, save=True):
+    """Mide en esta maquina a partir de que longitud de lista conviene NumPy.
+
+    Para cada estadistico se compara Python puro contra NumPy (incluida la
+    conversion de la lista) y se toma la primera longitud en que NumPy es
+    mas rapido. Si ``save``, los umbrales se guardan en ``CALIBRATION_FILE``.
+    """
+    global _thresholds
+    rng = np.random.default_rng(0)
+    kwargs = {"mean": {}, "var": {"ddof": 1}, "median": {}}
+    result = {}
+    for stat, impls in _IMPLEMENTATIONS.items():
+        result[stat] = sizes[-1] * 2
+        for n in sizes:
+            data = rng.random(n).tolist()
+            timings = {
+                backend: min(timeit.repeat(
+                    lambda: impls[backend](data, **kwargs[stat]),
+                    number=max(1, 10_000 // n), repeat=repeat))
+                for backend in ("python", "numpy")
+            }
+            if timings["numpy"] < timings["python"]:
+                result[stat] = n
+                break
+    logger.info("umbrales calibrados: %s", result)
+    if save:
+        os.makedirs(os.path.dirname(CALIBRATION_FILE), exist_ok=True)
+        with open(CALIBRATION_FILE, "w") as f:
+            json.dump(result, f, indent=2)
+    _thresholds = dict(DEFAULT_THRESHOLDS, **result)
+    return result
@@ -0,0 +1,109 @@
+"""Reduccion de series largas antes de dibujarlas como lineas.
+
+Una pantalla no muestra mas que unos pocos miles de puntos por serie, pero
+``ax.plot(data)`` envia todos. Aqui cada serie se reduce a ``n_out`` puntos
+elegidos de modo que la linea se vea igual:
+
+* ``"lttb"``: Largest-Triangle-Three-Buckets (Steinarsson, 2013). En cada
+  grupo de indices se elige el punto que forma el triangulo de mayor area
+  con el punto elegido antes y el promedio del grupo siguiente.
+* ``"minmax"``: el minimo y el maximo de cada grupo, en el orden en que
+  aparecen; conserva exactamente todos los picos.
+
+Si ``y`` es una matriz (una serie por columna, como en ``ax.plot``) todas
+las series se procesan juntas con operaciones vectorizadas.
+
+>>> x, y = downsample([0, 1, 5, 1, 0, -4, 0, 1], n_out=4, method="minmax")
+>>> x.tolist(), y.tolist()
+([0, 2, 5, 7], [0.0, 5.0, -4.0, 1.0])
+"""
+
+import numpy as np
+
+METHODS = ("lttb", "minmax")
+
+
+def downsample(y, x=None, n_out=1000, method="lttb"):
+    """Reduce cada serie de ``y`` a ``n_out`` puntos.
+
+    ``y`` es un vector o una matriz con una serie por columna; ``x`` es el
+    eje comun (por defecto, los indices). Retorna ``(x, y)`` listos para
+    ``ax.plot(x, y)``; con varias series ``x`` tiene una columna por serie,
+    porque cada serie conserva indices distintos.
+    """
+    if method not in METHODS:
+        raise ValueError("metodo desconocido: {}".format(method))
+    y = np.asarray(y, dtype=np.float64)
+    single = y.ndim == 1
+    y2 = y.reshape(y.shape[0], -1)
+    n = y2.shape[0]
+    x = np.arange(n) if x is None else np.asarray(x)
+    if x.shape != (n,):
+        raise ValueError("x debe tener una entrada por fila de y")
+    if n <= n_out:
+        index = np.broadcast_to(np.arange(n)[:, None], y2.shape)
+    elif method == "lttb":
+        index = _lttb(x.astype(np.float64), y2, n_out)
+    else:
+        index = _minmax(y2, n_out)
+    cols = np.arange(y2.shape[1])
+    xs, ys = x[index], y2[index, cols]
+    return (xs[:, 0], ys[:, 0]) if single else (xs, ys)
+
+
+def _edges(start, stop, buckets):
+    return np.linspace(start, stop, buckets + 1).astype(np.intp)
+
+
+def _lttb(x, y, n_out):
+    """Indices elegidos por LTTB, una columna por serie."""
+    if n_out < 3:
+        raise ValueError("LTTB necesita n_out >= 3")
+    n, k = y.shape
+    # El primer y el ultimo punto se conservan; el resto se reparte en
+    # n_out - 2 grupos
+    edges = _edges(1, n - 1, n_out - 2)
+    sizes = np.diff(edges)
+    mean_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / sizes
+    mean_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1, axis=0) / sizes[:, None]
+    # El "grupo siguiente" del ultimo grupo es el ultimo punto
+    mean_x = np.append(mean_x[1:], x[-1])
+    mean_y = np.vstack((mean_y[1:], y[-1:]))
+
+    index = np.empty((n_out, k), dtype=np.intp)
+    index[0], index[-1] = 0, n - 1
+    cols = np.arange(k)
+    prev = np.zeros(k, dtype=np.intp)
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[prev], y[prev, cols]
+        cx, cy = mean_x[i], mean_y[i]
+        bx, by = x[lo:hi, None], y[lo:hi]
+        # El doble del area del triangulo (a, b, c) para cada candidato b
+        area = np.abs((ax - cx) * (by - ay) - (ax - bx) * (cy - ay))
+        prev = lo + np.argmax(area, axis=0)
+        index[i + 1] = prev
+    return index
+
+
+def _minmax(y, n_out):
+    """Indices del minimo y el maximo de cada grupo, en orden."""
+    n, k = y.shape
+    buckets = max(1, n_out // 2)
+    size = -(-n // buckets)
+    if np.isnan(y).any():
+        # Los NaN no se eligen salvo que el grupo no tenga otro valor
+        low, high = np.where(np.isnan(y), np.inf, y), np.where(np.isnan(y), -np.inf, y)
+    else:
+        low = high = y
+    # Los grupos completos se agrupan con reshape sin copiar; el ultimo,
+    # mas corto, aparte
+    full = n // size
+    offset = (np.arange(full) * size)[:, None]
+    imin = offset + np.argmin(low[:full * size].reshape(full, size, k), axis=1)
+    imax = offset + np.argmax(high[:full * size].reshape(full, size, k), axis=1)
+    if full * size < n:
+        imin = np.vstack((imin, full * size + np.argmin(low[full * size:], axis=0)))
+        imax = np.vstack((imax, full * size + np.argmax(high[full * size:], axis=0)))
+    return np.stack((np.minimum(imin, imax), np.maximum(imin, imax)),
+                    axis=1).reshape(-1, k)
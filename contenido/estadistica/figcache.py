@@ -0,0 +1,232 @@
+"""Cache en disco de figuras ya dibujadas.
+
+Funciones como ``central_measures(df)`` vuelven a construir la figura de
+matplotlib en cada ejecucion del notebook aunque los datos no cambien.
+``FigureCache`` guarda la imagen (PNG o SVG) bajo una clave que es el hash
+de los bytes de los datos, de los demas parametros y del estilo vigente
+(``plt.style.use(...)`` cambia ``rcParams``). Si la clave ya existe se
+retorna la imagen guardada sin dibujar nada. Cuando el directorio supera
+``max_bytes`` se borran las imagenes usadas hace mas tiempo.
+
+::
+
+    cache = FigureCache()
+
+    @cache.cached
+    def central_measures(data):
+        fig, ax = plt.subplots(...)
+        ...
+        return fig
+
+    central_measures(df)   # dibuja y guarda
+    central_measures(df)   # retorna la imagen guardada
+
+El directorio por defecto se puede cambiar con la variable de entorno
+``ESTADISTICA_FIGURES``.
+"""
+
+import functools
+import hashlib
+import os
+import tempfile
+import types
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = os.environ.get(
+    "ESTADISTICA_FIGURES",
+    os.path.join(os.path.expanduser("~"), ".cache", "estadistica", "figures"))
+
+FORMATS = ("png", "svg")
+
+
+class CachedFigure:
+    """Imagen guardada en el cache; los notebooks la muestran directamente."""
+
+    def __init__(self, path, fmt):
+        self.path = path
+        self.format = fmt
+
+    def read(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def _repr_png_(self):
+        return self.read() if self.format == "png" else None
+
+    def _repr_svg_(self):
+        return self.read().decode("utf-8") if self.format == "svg" else None
+
+    def __repr__(self):
+        return "CachedFigure({!r})".format(self.path)
+
+
+class FigureCache:
+    """Imagenes de figuras en ``directory``, limitadas a ``max_bytes``."""
+
+    def __init__(self, directory=None, max_bytes=256 << 20, fmt="png", dpi=None):
+        if fmt not in FORMATS:
+            raise ValueError("formato no soportado: {}".format(fmt))
+        self.directory = CACHE_DIR if directory is None else directory
+        self.max_bytes = int(max_bytes)
+        self.format = fmt
+        self.dpi = dpi
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, *args, **kwargs):
+        """Hash de los argumentos y del estilo vigente de matplotlib."""
+        digest = hashlib.sha256()
+        for value in args:
+            _feed(digest, value)
+        for name in sorted(kwargs):
+            digest.update(name.encode())
+            _feed(digest, kwargs[name])
+        digest.update(_style().encode())
+        digest.update("{}:{}".format(self.format, self.dpi).encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, "{}.{}".format(key, self.format))
+
+    def get(self, key):
+        """``CachedFigure`` de ``key``, o ``None`` si no esta guardada."""
+        path = self._path(key)
+        try:
+            # La fecha de modificacion registra el ultimo uso (LRU)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return CachedFigure(path, self.format)
+
+    def put(self, key, fig):
+        """Guarda ``fig`` bajo ``key`` y retorna su ``CachedFigure``."""
+        path = self._path(key)
+        fd, tmp = tempfile.mkstemp(suffix="." + self.format, dir=self.directory)
+        with os.fdopen(fd, "wb") as f:
+            fig.savefig(f, format=self.format, dpi=self.dpi, bbox_inches="tight")
+        os.replace(tmp, path)
+        self.evict(keep=path)
+        return CachedFigure(path, self.format)
+
+    def evict(self, keep=None):
+        """Borra las imagenes usadas hace mas tiempo hasta respetar
+        ``max_bytes``; ``keep`` (una ruta) no se borra nunca."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(FORMATS):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(FORMATS):
+                os.remove(entry.path)
+
+    def cached(self, func):
+        """Decorador: ``func`` dibuja una figura y la retorna (o la deja
+        como figura actual); el resultado se guarda segun sus argumentos y
+        su codigo, de modo que editar ``func`` invalida lo guardado.
+
+        ``func`` no debe llamar a ``plt.show()``, que cierra la figura.
+        """
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = self.key(func.__module__, func.__qualname__, func.__code__,
+                           *args, **kwargs)
+            hit = self.get(key)
+            if hit is not None:
+                return hit
+            import matplotlib.pyplot as plt
+            from matplotlib.figure import Figure
+            result = func(*args, **kwargs)
+            fig = result if isinstance(result, Figure) else plt.gcf()
+            image = self.put(key, fig)
+            plt.close(fig)
+            return image
+        return wrapper
+
+
+def _feed(digest, value):
+    """Agrega ``value`` al hash: bytes para arreglos y tablas; listas,
+    tuplas, diccionarios y conjuntos elemento por elemento.
+
+    Cada valor lleva una etiqueta con su tipo y su longitud, de modo que
+    ``1``, ``"1"`` y ``True`` o ``["ab"]`` y ``["a", "b"]`` no comparten
+    clave. Los tipos que no se saben hashear producen ``TypeError``.
+    """
+    if isinstance(value, pd.DataFrame):
+        digest.update(b"frame")
+        _feed(digest, [str(c) for c in value.columns])
+        _feed(digest, value.index)
+        for name in value.columns:
+            _feed(digest, value[name])
+    elif isinstance(value, (pd.Series, pd.Index)):
+        digest.update(b"series")
+        _feed(digest, str(value.name))
+        digest.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update("array:{}:{}".format(value.dtype.str, value.shape).encode())
+        if value.dtype.hasobject:
+            _feed(digest, value.tolist())
+        else:
+            digest.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, np.generic):
+        _feed(digest, np.asarray(value))
+    elif isinstance(value, (list, tuple)):
+        digest.update("{}:{}".format(type(value).__name__, len(value)).encode())
+        for item in value:
+            _feed(digest, item)
+    elif isinstance(value, dict):
+        # El orden de insercion no cambia la clave
+        items = sorted(_digest(k) + _digest(v) for k, v in value.items())
+        digest.update("dict:{}".format(len(items)).encode())
+        digest.update(b"".join(items))
+    elif isinstance(value, (set, frozenset)):
+        items = sorted(_digest(item) for item in value)
+        digest.update("set:{}".format(len(items)).encode())
+        digest.update(b"".join(items))
+    elif isinstance(value, types.CodeType):
+        _feed_code(digest, value)
+    elif value is None or value is Ellipsis:
+        digest.update(repr(value).encode())
+    elif isinstance(value, (bool, int, float, complex)):
+        digest.update("{}:{!r}".format(type(value).__name__, value).encode())
+    elif isinstance(value, (str, bytes)):
+        data = value.encode() if isinstance(value, str) else value
+        digest.update("{}:{}:".format(type(value).__name__, len(data)).encode())
+        digest.update(data)
+    else:
+        raise TypeError("no se puede calcular la clave de un valor de tipo "
+                        "{}".format(type(value).__name__))
+
+
+def _digest(value):
+    digest = hashlib.sha256()
+    _feed(digest, value)
+    return digest.digest()
+
+
+def _feed_code(digest, code):
+    """Bytecode, constantes (con las funciones anidadas) y nombres usados
+    por ``code``: redefinir la funcion cambia la clave."""
+    digest.update(b"code")
+    digest.update(code.co_code)
+    _feed(digest, code.co_consts)
+    _feed(digest, code.co_names)
+
+
+def _style():
+    import matplotlib
+    return repr(sorted((k, repr(v)) for k, v in matplotlib.rcParams.items()))
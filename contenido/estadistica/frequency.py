@@ -0,0 +1,121 @@
+"""Tablas de frecuencia a partir de conteos ya agregados.
+
+Cuando los datos vienen como pares (valor, conteo), como ``hits_per_game``
+y ``games``, no hace falta repetir cada valor para calcular frecuencias,
+cuantiles, media o varianza: todo se obtiene de los conteos.
+
+>>> table = FrequencyTable([0, 1, 2, 3], [20, 72, 209, 527])
+>>> float(table.mean()), float(table.quantile(0.5))
+(2.501207729468599, 3.0)
+"""
+
+import numpy as np
+import pandas as pd
+
+from .histogram import Histogram
+from .mode import ModeResult, frequencies
+
+
+class FrequencyTable:
+    """Pares (valor, conteo) ordenados por valor, sin valores repetidos."""
+
+    def __init__(self, values, counts):
+        values = np.asarray(values).reshape(-1)
+        counts = np.asarray(counts).reshape(-1)
+        if values.shape != counts.shape:
+            raise ValueError("values y counts deben tener la misma longitud")
+        if np.any(counts < 0):
+            raise ValueError("los conteos no pueden ser negativos")
+        uniques, inverse = np.unique(values, return_inverse=True)
+        self.values = uniques
+        self.counts = np.bincount(inverse, weights=counts,
+                                  minlength=uniques.size).astype(counts.dtype)
+
+    @classmethod
+    def from_data(cls, data):
+        """Tabla de frecuencias de datos sin agregar."""
+        return cls(*frequencies(data))
+
+    @classmethod
+    def from_frame(cls, frame, value, count):
+        """Tabla a partir de dos columnas de un ``DataFrame``."""
+        return cls(frame[value].to_numpy(), frame[count].to_numpy())
+
+    def merge(self, other):
+        return FrequencyTable(np.concatenate((self.values, other.values)),
+                              np.concatenate((self.counts, other.counts)))
+
+    @property
+    def total(self):
+        return self.counts.sum()
+
+    def relative(self):
+        """Frecuencia relativa de cada valor."""
+        return self.counts / self.total
+
+    def cumulative(self):
+        """Frecuencia acumulada."""
+        return np.cumsum(self.counts)
+
+    def cumulative_relative(self):
+        """Frecuencia relativa acumulada."""
+        return self.cumulative() / self.total
+
+    def to_frame(self):
+        return pd.DataFrame({
+            "value": self.values,
+            "count": self.counts,
+            "freq_rel": self.relative(),
+            "freq_cum": self.cumulative(),
+            "freq_rel_cum": self.cumulative_relative(),
+        })
+
+    def mean(self):
+        return np.dot(self.counts, self.values) / self.total
+
+    def var(self, ddof=0):
+        """Varianza de los datos que representa la tabla."""
+        dev = self.values - self.mean()
+        return np.dot(self.counts, dev * dev) / (self.total - ddof)
+
+    def std(self, ddof=0):
+        return np.sqrt(self.var(ddof))
+
+    def quantile(self, q):
+        """Cuantil(es) con la interpolacion lineal de ``np.quantile``, igual
+        que si se repitiera cada valor tantas veces como su conteo."""
+        q = np.asarray(q, dtype=np.float64)
+        ends = np.cumsum(self.counts)
+        pos = q * (ends[-1] - 1)
+        lo = np.floor(pos)
+        # El dato de posicion k (base 0) es el primer valor con ends > k
+        a = self.values[np.searchsorted(ends, lo, side="right")]
+        b = self.values[np.searchsorted(ends, np.minimum(lo + 1, ends[-1] - 1),
+                                        side="right")]
+        return (a + (b - a) * (pos - lo))[()]
+
+    def mode(self):
+        top = self.counts.max()
+        return ModeResult(self.values[self.counts == top], top.item())
+
+    def histogram(self, bins=10, range=None):
+        """Re-agrupa la tabla en intervalos; retorna ``(counts, edges)``."""
+        if np.ndim(bins) == 0:
+            if range is None:
+                # Como np.histogram sobre los datos repetidos: solo cuentan
+                # los valores presentes y un rango nulo se amplia en 0.5
+                present = self.values[self.counts > 0]
+                if present.size == 0:
+                    raise ValueError("la tabla no tiene datos")
+                lo, hi = float(present[0]), float(present[-1])
+                if lo == hi:
+                    lo, hi = lo - 0.5, hi + 0.5
+                range = (lo, hi)
+            hist = Histogram(bins=int(bins), range=range)
+        else:
+            hist = Histogram(bins)
+        hist.update(self.values, weights=self.counts)
+        counts, edges = hist.to_numpy()
+        if self.counts.dtype.kind in "iu":
+            counts = counts.astype(self.counts.dtype)
+        return counts, edges
@@ -0,0 +1,165 @@
+"""Histogramas que se acumulan por bloques y se pueden combinar.
+
+* ``Histogram``: intervalos fijos; cada bloque se ubica con
+  ``np.searchsorted`` y se cuenta con ``np.bincount``. Sigue la convencion
+  de ``np.histogram``: intervalos [a, b) salvo el ultimo, que es [a, b].
+* ``AdaptiveHistogram``: intervalos que se adaptan a los datos con a lo
+  sumo ``max_bins`` centroides (Ben-Haim y Tom-Tov, 2010); sirve cuando no
+  se conoce el rango de antemano.
+
+Ambos se combinan con ``merge`` y se convierten a la tupla
+``(counts, edges)`` que retorna ``np.histogram``.
+"""
+
+import numpy as np
+
+from ._chunks import CHUNKSIZE, iter_chunks
+from .lazy import _reiterable
+
+
+class Histogram:
+    """Histograma con bordes fijos ``edges`` (crecientes)."""
+
+    def __init__(self, edges=None, bins=10, range=None):
+        if edges is None:
+            if range is None:
+                raise ValueError("se necesitan los bordes o el rango")
+            edges = np.linspace(range[0], range[1], bins + 1)
+        self.edges = np.asarray(edges, dtype=np.float64)
+        if self.edges.ndim != 1 or self.edges.size < 2 or np.any(np.diff(self.edges) <= 0):
+            raise ValueError("los bordes deben ser crecientes")
+        self.counts = np.zeros(self.edges.size - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    def update(self, chunk, weights=None):
+        x = np.asarray(chunk).reshape(-1)
+        idx = np.searchsorted(self.edges, x, side="right") - 1
+        # El borde derecho del ultimo intervalo esta incluido
+        idx[x == self.edges[-1]] = self.counts.size - 1
+        below = idx < 0
+        above = idx >= self.counts.size
+        inside = ~(below | above)
+        w = None if weights is None else np.asarray(weights).reshape(-1)
+        if w is None:
+            self.underflow += int(below.sum())
+            self.overflow += int(above.sum())
+            self.counts += np.bincount(idx[inside], minlength=self.counts.size)
+        else:
+            if self.counts.dtype.kind == "i":
+                self.counts = self.counts.astype(np.float64)
+            self.underflow += w[below].sum()
+            self.overflow += w[above].sum()
+            self.counts += np.bincount(idx[inside], weights=w[inside],
+                                       minlength=self.counts.size)
+        return self
+
+    def merge(self, other):
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("los histogramas tienen bordes distintos")
+        result = Histogram(self.edges)
+        result.counts = self.counts + other.counts
+        result.underflow = self.underflow + other.underflow
+        result.overflow = self.overflow + other.overflow
+        return result
+
+    def to_numpy(self):
+        """Tupla ``(counts, edges)`` como la de ``np.histogram``."""
+        return self.counts.copy(), self.edges.copy()
+
+
+class AdaptiveHistogram:
+    """Histograma de centroides con memoria acotada por ``max_bins``."""
+
+    def __init__(self, max_bins=64):
+        if max_bins < 2:
+            raise ValueError("se necesitan al menos dos intervalos")
+        self.max_bins = int(max_bins)
+        self.centers = np.empty(0)
+        self.counts = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, chunk):
+        x = np.sort(np.asarray(chunk, dtype=np.float64).reshape(-1))
+        if x.size == 0:
+            return self
+        self.min = min(self.min, x[0])
+        self.max = max(self.max, x[-1])
+        # El bloque se reduce primero a max_bins grupos del mismo tamaño
+        groups = np.array_split(x, min(self.max_bins, x.size))
+        counts = np.array([g.size for g in groups], dtype=np.float64)
+        centers = np.array([g.mean() for g in groups])
+        self._absorb(centers, counts)
+        return self
+
+    def merge(self, other):
+        result = AdaptiveHistogram(min(self.max_bins, other.max_bins))
+        result.centers, result.counts = self.centers, self.counts
+        result.min = min(self.min, other.min)
+        result.max = max(self.max, other.max)
+        result._absorb(other.centers, other.counts)
+        return result
+
+    def _absorb(self, centers, counts):
+        centers = np.concatenate((self.centers, centers))
+        counts = np.concatenate((self.counts, counts))
+        order = np.argsort(centers, kind="stable")
+        centers, counts = list(centers[order]), list(counts[order])
+        # Se unen los dos centroides mas cercanos hasta respetar max_bins
+        while len(centers) > self.max_bins:
+            i = int(np.argmin(np.diff(centers)))
+            total = counts[i] + counts[i + 1]
+            centers[i] = (centers[i] * counts[i] + centers[i + 1] * counts[i + 1]) / total
+            counts[i] = total
+            del centers[i + 1], counts[i + 1]
+        self.centers = np.array(centers)
+        self.counts = np.array(counts)
+
+    @property
+    def count(self):
+        return self.counts.sum()
+
+    def to_numpy(self):
+        """Tupla ``(counts, edges)``: un intervalo por centroide, con bordes
+        en los puntos medios entre centroides y en el minimo y el maximo."""
+        if self.centers.size == 0:
+            return np.zeros(0), np.array([0.0, 1.0])
+        mids = (self.centers[1:] + self.centers[:-1]) / 2
+        edges = np.concatenate(([self.min], mids, [self.max]))
+        return self.counts.copy(), edges
+
+
+def histogram(source, bins=10, range=None, chunksize=CHUNKSIZE):
+    """Equivalente por bloques de ``np.histogram(source, bins, range)``.
+
+    Si ``bins`` es un numero y no se da ``range``, se hace una pasada previa
+    para hallar el minimo y el maximo, por lo que ``source`` debe poder
+    recorrerse dos veces; para un iterable que se recorre una sola vez se
+    da ``range`` o se usa ``AdaptiveHistogram``.
+
+    >>> counts, edges = histogram([1280, 5320, 4390, 2100, 1240, 3060], bins=6, range=(0, 6000))
+    >>> counts.tolist()
+    [0, 2, 1, 1, 1, 1]
+    """
+    if np.ndim(bins) == 0:
+        if range is None:
+            if not _reiterable(source):
+                raise ValueError("sin range se necesita una pasada previa y la "
+                                 "fuente solo puede recorrerse una vez; indique "
+                                 "range o use AdaptiveHistogram")
+            lo, hi = np.inf, -np.inf
+            for chunk in iter_chunks(source, chunksize):
+                lo, hi = min(lo, chunk.min()), max(hi, chunk.max())
+            if lo > hi:
+                # Sin datos: el mismo rango que np.histogram
+                lo, hi = 0.0, 1.0
+            elif lo == hi:
+                lo, hi = lo - 0.5, hi + 0.5
+            range = (lo, hi)
+        hist = Histogram(bins=int(bins), range=range)
+    else:
+        hist = Histogram(bins)
+    for chunk in iter_chunks(source, chunksize):
+        hist.update(chunk)
+    return hist.to_numpy()
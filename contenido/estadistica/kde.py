@@ -0,0 +1,153 @@
+"""Estimacion de densidad por nucleo (KDE) agrupada y con FFT.
+
+La KDE exacta evalua un nucleo por cada dato en cada punto de la grilla,
+O(n * grilla). Aqui los datos se agrupan primero en una grilla regular
+(cada dato reparte su peso entre los dos puntos vecinos) y luego se
+convoluciona la grilla con el nucleo gaussiano usando la FFT, de modo que
+el costo es O(n + grilla log grilla).
+
+El ancho de banda puede ser un numero o una regla: ``"scott"`` (la que usa
+``sns.histplot(..., kde=True)``), ``"silverman"`` o ``"dpi"``, el plug-in
+directo de dos etapas de Wand y Jones, estimado tambien sobre la grilla.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+KDEResult = namedtuple("KDEResult", ["grid", "density"])
+
+_SQRT_2PI = np.sqrt(2 * np.pi)
+
+# Rango del nucleo en anchos de banda; fuera de el es despreciable
+_TAU = 6.0
+
+
+def kde(data, weights=None, bw="scott", bw_adjust=1.0, gridsize=512, cut=3,
+        clip=None):
+    """Densidad estimada de ``data`` sobre una grilla de ``gridsize`` puntos.
+
+    Retorna ``KDEResult(grid, density)``, que se puede dibujar directamente
+    con ``ax.plot(*kde(data))``. La grilla se extiende ``cut`` anchos de
+    banda mas alla de los datos, limitada por ``clip``.
+
+    >>> grid, density = kde([1.0, 2.0, 2.5, 4.0], gridsize=64)
+    >>> round(float(density.sum() * (grid[1] - grid[0])), 2)
+    1.0
+    """
+    x, w = _prepare(data, weights)
+    h = bandwidth(x, w, bw) * bw_adjust
+    if not (np.isfinite(h) and h > 0):
+        raise ValueError("el ancho de banda debe ser positivo (los datos son "
+                         "constantes?); indique bw como numero")
+    lo, hi = x.min() - cut * h, x.max() + cut * h
+    if clip is not None:
+        lo, hi = max(lo, clip[0]), min(hi, clip[1])
+    grid, counts = _linear_binning(x, w, lo, hi, gridsize)
+    delta = grid[1] - grid[0]
+    offsets = _offsets(h, delta, gridsize)
+    kernel = np.exp(-0.5 * (offsets * delta / h) ** 2) / (h * _SQRT_2PI)
+    density = np.maximum(_convolve(counts, kernel), 0.0)
+    return KDEResult(grid, density)
+
+
+def bandwidth(data, weights=None, method="scott"):
+    """Ancho de banda segun ``method`` (o el numero dado)."""
+    if np.ndim(method) == 0 and not isinstance(method, str):
+        return float(method)
+    x, w = _prepare(data, weights)
+    n = _effective_size(w)
+    if method == "scott":
+        return _std(x, w) * n ** (-1 / 5)
+    if method == "silverman":
+        return 0.9 * _scale(x, w) * n ** (-1 / 5)
+    if method == "dpi":
+        return _dpi(x, w, n)
+    raise ValueError("regla de ancho de banda desconocida: {}".format(method))
+
+
+def _prepare(data, weights):
+    x = np.asarray(data, dtype=np.float64).reshape(-1)
+    w = (np.ones_like(x) if weights is None
+         else np.asarray(weights, dtype=np.float64).reshape(-1))
+    keep = np.isfinite(x) & (w > 0)
+    x, w = x[keep], w[keep]
+    if x.size < 2:
+        raise ValueError("se necesitan al menos dos datos")
+    return x, w / w.sum()
+
+
+def _effective_size(w):
+    # Con pesos normalizados, n efectivo = 1 / sum(w_i^2)
+    return 1.0 / np.dot(w, w)
+
+
+def _std(x, w):
+    mean = np.dot(w, x)
+    return np.sqrt(np.dot(w, (x - mean) ** 2))
+
+
+def _scale(x, w):
+    order = np.argsort(x)
+    cdf = np.cumsum(w[order])
+    q1, q3 = np.interp([0.25, 0.75], cdf, x[order])
+    std = _std(x, w)
+    iqr = (q3 - q1) / 1.349
+    return min(std, iqr) if iqr > 0 else std
+
+
+def _linear_binning(x, w, lo, hi, gridsize):
+    grid = np.linspace(lo, hi, gridsize)
+    pos = (x - lo) / (grid[1] - grid[0])
+    inside = (pos >= 0) & (pos <= gridsize - 1)
+    pos, w = pos[inside], w[inside]
+    left = np.minimum(np.floor(pos).astype(np.intp), gridsize - 2)
+    frac = pos - left
+    counts = (np.bincount(left, weights=w * (1 - frac), minlength=gridsize)
+              + np.bincount(left + 1, weights=w * frac, minlength=gridsize))
+    return grid, counts
+
+
+def _offsets(g, delta, gridsize):
+    span = int(min(gridsize - 1, np.ceil(_TAU * g / delta)))
+    return np.arange(-span, span + 1)
+
+
+def _convolve(counts, kernel):
+    """Convolucion lineal (no circular) de la grilla con el nucleo."""
+    span = kernel.size // 2
+    size = counts.size + kernel.size - 1
+    nfft = 1 << (size - 1).bit_length()
+    full = np.fft.irfft(np.fft.rfft(counts, nfft) * np.fft.rfft(kernel, nfft), nfft)
+    return full[span:span + counts.size]
+
+
+def _psi(x, w, g, r):
+    """Funcional de densidad psi_r con nucleo de derivada r y ancho g,
+    estimado sobre la grilla."""
+    gridsize = 401
+    lo, hi = x.min(), x.max()
+    grid, counts = _linear_binning(x, w, lo, hi, gridsize)
+    delta = grid[1] - grid[0]
+    u = _offsets(g, delta, gridsize) * delta / g
+    phi = np.exp(-0.5 * u * u) / _SQRT_2PI
+    hermite = {4: u ** 4 - 6 * u ** 2 + 3,
+               6: u ** 6 - 15 * u ** 4 + 45 * u ** 2 - 15}[r]
+    smooth = _convolve(counts, hermite * phi)
+    return np.dot(counts, smooth) / g ** (r + 1)
+
+
+def _dpi(x, w, n):
+    # Plug-in directo de dos etapas (Wand y Jones, 1995, seccion 3.6)
+    sigma = _scale(x, w)
+    if sigma == 0:
+        return 0.0
+    psi8 = 105 / (32 * np.sqrt(np.pi) * sigma ** 9)
+    g1 = (30 / (_SQRT_2PI * psi8 * n)) ** (1 / 9)
+    psi6 = _psi(x, w, g1, 6)
+    g2 = (-6 / (_SQRT_2PI * psi6 * n)) ** (1 / 7)
+    psi4 = _psi(x, w, g2, 4)
+    h = (1 / (2 * np.sqrt(np.pi) * psi4 * n)) ** (1 / 5)
+    # Con muestras muy pequeñas los funcionales pueden salir con el signo
+    # equivocado; en ese caso se usa la regla de Silverman
+    return h if np.isfinite(h) and h > 0 else 0.9 * sigma * n ** (-1 / 5)
@@ -0,0 +1,141 @@
+"""Resumen diferido: se declaran los estadisticos y se calculan juntos.
+
+``np.mean``, ``np.var``, ``np.min``, ``np.quantile``... recorren cada uno
+los datos completos. ``Summary`` solo registra lo que se pide y, al llamar
+``compute()``, agrupa todo en el menor numero de pasadas por bloques:
+
+* pasada 1: conteo, media, varianza, desviacion, extremos y cuantiles
+  (con ``KLLSketch``, o con ``ExactQuantiles`` si se piden exactos);
+* pasada 2, solo si se pide: desviacion media absoluta, que necesita la
+  media de la pasada anterior.
+
+Como en ``summarize``, los valores faltantes y los infinitos se omiten.
+
+>>> s = Summary([27.3, 27.9, 32.9, 35.2, 44.9, 39.9, 30.0, 29.7, 28.5, 32.0, 37.6])
+>>> r = s.mean().var(ddof=1).quantile([0.25, 0.75]).compute()
+>>> round(float(r["var"]), 4), s.passes
+(31.4105, 1)
+"""
+
+import numpy as np
+import pandas as pd
+
+from ._chunks import CHUNKSIZE, drop_nonfinite, iter_chunks
+from .moments import Moments
+from .sketch import ExactQuantiles, KLLSketch
+
+
+class Summary:
+    """Constructor diferido de estadisticos descriptivos de ``data``.
+
+    ``dtype`` es el tipo en que se leen los bloques y ``acc_dtype`` el de
+    los acumuladores, como en ``moments``.
+    """
+
+    def __init__(self, data, chunksize=CHUNKSIZE, dtype=None, acc_dtype=np.float64):
+        self.data = data
+        self.chunksize = chunksize
+        self.dtype = dtype
+        self.acc_dtype = acc_dtype
+        self.passes = 0
+        self._stats = {}
+        self._exact = False
+
+    def _request(self, name, **options):
+        self._stats[name] = options
+        return self
+
+    def count(self):
+        return self._request("count")
+
+    def mean(self):
+        return self._request("mean")
+
+    def var(self, ddof=0):
+        return self._request("var", ddof=ddof)
+
+    def std(self, ddof=0):
+        return self._request("std", ddof=ddof)
+
+    def min(self):
+        return self._request("min")
+
+    def max(self):
+        return self._request("max")
+
+    def range(self):
+        return self._request("range")
+
+    def mad(self):
+        """Desviacion media absoluta respecto a la media."""
+        return self._request("mad")
+
+    def quantile(self, qs, exact=False):
+        """Cuantiles ``qs``; aproximados con ``KLLSketch`` salvo ``exact``."""
+        for q in np.atleast_1d(qs).tolist():
+            self._request("{:g}%".format(100 * q), q=q)
+        self._exact = self._exact or exact
+        return self
+
+    def describe(self, exact=False):
+        """Los mismos campos de ``DataFrame.describe()``."""
+        return (self.count().mean().std(ddof=1).min()
+                .quantile([0.25, 0.5, 0.75], exact=exact).max())
+
+    def plan(self):
+        """Lista de pasadas; cada una con los estadisticos que calcula."""
+        first = [name for name in self._stats if name != "mad"]
+        if "mad" in self._stats:
+            first = first or ["mean"]
+            return [first, ["mad"]]
+        return [first] if first else []
+
+    def compute(self):
+        """Ejecuta el plan y retorna una ``Series`` con los resultados."""
+        plan = self.plan()
+        if len(plan) > 1 and not _reiterable(self.data):
+            raise ValueError("la desviacion media absoluta necesita una segunda "
+                             "pasada y la fuente solo puede recorrerse una vez")
+        moments = Moments(self.acc_dtype)
+        qs = [options["q"] for options in self._stats.values() if "q" in options]
+        sketch = None
+        if qs:
+            sketch = ExactQuantiles() if self._exact else KLLSketch()
+        self.passes = 0
+        if plan:
+            for chunk in iter_chunks(self.data, self.chunksize, dtype=self.dtype):
+                chunk = drop_nonfinite(chunk)
+                moments.update(chunk)
+                if sketch is not None:
+                    sketch.update(chunk)
+            self.passes = 1
+
+        quants = dict(zip(qs, np.atleast_1d(sketch.quantile(qs)))) if qs else {}
+        results = {}
+        for name, options in self._stats.items():
+            if "q" in options:
+                results[name] = quants[options["q"]]
+            elif name == "count":
+                results[name] = moments.count
+            elif name == "mean":
+                results[name] = moments.mean if moments.count else np.nan
+            elif name in ("var", "std"):
+                results[name] = getattr(moments, name)(options["ddof"])
+            elif name in ("min", "max"):
+                results[name] = getattr(moments, name) if moments.count else np.nan
+            elif name == "range":
+                results[name] = moments.range()
+
+        if "mad" in self._stats:
+            mean, total = moments.mean, 0.0
+            for chunk in iter_chunks(self.data, self.chunksize, dtype=self.dtype):
+                chunk = drop_nonfinite(chunk)
+                dev = np.abs(chunk.astype(self.acc_dtype) - mean)
+                total += dev.sum(dtype=self.acc_dtype)
+            results["mad"] = total / moments.count if moments.count else np.nan
+            self.passes += 1
+        return pd.Series(results, dtype=np.float64)
+
+
+def _reiterable(data):
+    return iter(data) is not data
@@ -0,0 +1,143 @@
+"""Moda y frecuencias para columnas grandes.
+
+La estrategia se elige segun el tipo de dato:
+
+* enteros en un rango pequeño: ``np.bincount`` directo sobre los valores;
+* categoricos de pandas: ``np.bincount`` sobre los codigos;
+* cualquier otro tipo: tabla hash (``pd.factorize``) y ``np.bincount``;
+* datos sin limite (flujos): ``HeavyHitters``, que guarda un numero fijo
+  de contadores.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from ._chunks import CHUNKSIZE, iter_chunks
+
+ModeResult = namedtuple("ModeResult", ["values", "count"])
+
+# Rango minimo permitido para contar enteros con bincount directo; por
+# encima de este, el rango no puede superar 2n
+_DENSE_MIN_SPAN = 1 << 16
+
+
+def frequencies(data, strategy="auto"):
+    """Retorna ``(valores, conteos)`` de los valores distintos de ``data``.
+
+    ``strategy`` puede ser ``"auto"``, ``"bincount"`` o ``"hash"``. Los
+    valores faltantes (NaN) no se cuentan.
+    """
+    if isinstance(getattr(data, "dtype", None), pd.CategoricalDtype):
+        cat = pd.Categorical(data)
+        codes = cat.codes[cat.codes >= 0]
+        counts = np.bincount(codes, minlength=len(cat.categories))
+        return np.asarray(cat.categories), counts
+
+    x = np.asarray(data).reshape(-1)
+    data_dtype = x.dtype
+    if strategy == "auto":
+        strategy = "bincount" if _is_dense(x) else "hash"
+    if strategy == "bincount":
+        if x.size == 0:
+            return x, np.zeros(0, dtype=np.intp)
+        # Se resta el minimo antes de convertir a intp: los uint64 mayores
+        # que 2^63 no caben en intp, pero su distancia al minimo si
+        x = x.astype(np.uint64 if x.dtype.kind in "ub" else np.int64)
+        lo = x.min()
+        counts = np.bincount((x - lo).astype(np.intp))
+        values = np.flatnonzero(counts)
+        return (values.astype(x.dtype) + lo).astype(data_dtype), counts[values]
+    if strategy == "hash":
+        codes, uniques = pd.factorize(x)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        return np.asarray(uniques), counts
+    raise ValueError("estrategia desconocida: {}".format(strategy))
+
+
+def mode(data, strategy="auto"):
+    """Moda(s) de ``data``: todos los valores empatados con el mayor conteo.
+
+    >>> mode([90, 102, 110, 115, 85, 90, 100, 110, 110])
+    ModeResult(values=array([110]), count=3)
+    """
+    values, counts = frequencies(data, strategy)
+    if counts.size == 0:
+        return ModeResult(values[:0], 0)
+    top = counts.max()
+    return ModeResult(np.sort(values[counts == top]), int(top))
+
+
+def _is_dense(x):
+    if x.dtype.kind not in "iub" or x.size == 0:
+        return False
+    span = int(x.max()) - int(x.min()) + 1
+    return span <= max(2 * x.size, _DENSE_MIN_SPAN)
+
+
+class HeavyHitters:
+    """Valores mas frecuentes de un flujo con ``capacity`` contadores
+    (resumen de Misra-Gries combinable).
+
+    Cada conteo estimado subestima el real en a lo sumo ``error``, que no
+    supera n / (capacity + 1); todo valor con frecuencia mayor que esa cota
+    esta garantizado en el resumen.
+    """
+
+    def __init__(self, capacity=1024):
+        self.capacity = int(capacity)
+        self.count = 0
+        self.error = 0
+        self.keys = np.empty(0)
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def update(self, chunk):
+        keys, counts = frequencies(chunk, strategy="hash")
+        self.count += int(counts.sum())
+        self._absorb(keys, counts.astype(np.int64), 0)
+        return self
+
+    def merge(self, other):
+        result = HeavyHitters(min(self.capacity, other.capacity))
+        result.count = self.count + other.count
+        result.keys, result.counts = self.keys, self.counts
+        result.error = self.error
+        result._absorb(other.keys, other.counts, other.error)
+        return result
+
+    def _absorb(self, keys, counts, error):
+        keys = np.concatenate((self.keys, keys)) if self.keys.size else keys
+        codes, uniques = pd.factorize(keys)
+        counts = np.bincount(codes, weights=np.concatenate((self.counts, counts)),
+                             minlength=len(uniques)).astype(np.int64)
+        self.error += error
+        if len(uniques) > self.capacity:
+            # Se resta el conteo (capacity+1)-esimo y se descartan los que
+            # quedan sin conteo positivo
+            cut = np.partition(counts, -(self.capacity + 1))[-(self.capacity + 1)]
+            counts = counts - cut
+            self.error += int(cut)
+            keep = counts > 0
+            uniques, counts = uniques[keep], counts[keep]
+        self.keys, self.counts = np.asarray(uniques), counts
+
+    def top(self, k=10):
+        """Los ``k`` valores mas frecuentes y sus conteos estimados."""
+        order = np.argsort(-self.counts, kind="stable")[:k]
+        return self.keys[order], self.counts[order]
+
+    def mode(self):
+        """Moda(s) estimadas del flujo."""
+        if self.counts.size == 0:
+            return ModeResult(self.keys[:0], 0)
+        top = self.counts.max()
+        return ModeResult(self.keys[self.counts == top], int(top))
+
+
+def stream_mode(source, capacity=1024, chunksize=CHUNKSIZE):
+    """Moda de un flujo por bloques usando ``HeavyHitters``."""
+    sketch = HeavyHitters(capacity)
+    for chunk in iter_chunks(source, chunksize):
+        sketch.update(chunk)
+    return sketch.mode()
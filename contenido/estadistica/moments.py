@@ -0,0 +1,128 @@
+"""Media, varianza y desviacion estandar en una sola pasada.
+
+Se usa la actualizacion de Welford para datos que llegan uno a uno y la
+combinacion de Chan et al. para bloques y resultados parciales, de modo que
+la memoria usada no depende del tamaño de los datos.
+
+Los bloques se leen en su tipo de almacenamiento (por ejemplo ``float32``)
+y solo los acumuladores usan ``dtype`` (``float64`` por defecto); la suma
+dentro de cada bloque es por parejas, asi que la precision es la misma que
+si los datos estuvieran guardados en ``float64``.
+
+Como en NumPy, un ``NaN`` en los datos se propaga: la media, la varianza,
+el minimo y el maximo quedan en ``NaN``.
+"""
+
+import math
+
+import numpy as np
+
+from ._chunks import CHUNKSIZE, iter_chunks
+from .summation import pairwise_sum
+
+
+class Moments:
+    """Acumulador de conteo, media, M2 (suma de cuadrados de las
+    desviaciones de la media), minimo y maximo.
+
+    ``dtype`` es el tipo de los acumuladores de media y M2.
+    """
+
+    __slots__ = ("count", "mean", "m2", "min", "max", "dtype")
+
+    def __init__(self, dtype=np.float64):
+        # Acepta tambien "float64" o np.dtype("float64")
+        dtype = np.dtype(dtype).type
+        self.dtype = dtype
+        self.count = 0
+        self.mean = dtype(0)
+        self.m2 = dtype(0)
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x):
+        """Agrega un dato (actualizacion de Welford)."""
+        x = self.dtype(x)
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.min = _nanpropagating(min, self.min, float(x))
+        self.max = _nanpropagating(max, self.max, float(x))
+        return self
+
+    def update(self, chunk):
+        """Agrega un bloque de datos."""
+        x = np.asarray(chunk).reshape(-1)
+        if x.size == 0:
+            return self
+        mean = pairwise_sum(x, self.dtype) / x.size
+        dev = x.astype(self.dtype) - mean
+        self._combine(x.size, mean, np.dot(dev, dev),
+                      float(x.min()), float(x.max()))
+        return self
+
+    def merge(self, other):
+        """Combina dos acumuladores y retorna uno nuevo."""
+        result = self.copy()
+        result._combine(other.count, other.mean, other.m2, other.min, other.max)
+        return result
+
+    def copy(self):
+        result = Moments(self.dtype)
+        for name in self.__slots__:
+            setattr(result, name, getattr(self, name))
+        return result
+
+    def _combine(self, count, mean, m2, min_, max_):
+        # Combinacion de Chan et al. de dos particiones
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = _nanpropagating(min, self.min, min_)
+        self.max = _nanpropagating(max, self.max, max_)
+
+    def var(self, ddof=0):
+        """Varianza con ``ddof`` grados de libertad, igual que ``np.var``."""
+        if self.count - ddof <= 0:
+            return math.nan
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=0):
+        """Desviacion estandar, igual que ``np.std``."""
+        return math.sqrt(self.var(ddof))
+
+    def range(self):
+        """Rango: maximo menos minimo."""
+        return self.max - self.min if self.count else math.nan
+
+    def __repr__(self):
+        return "Moments(count={}, mean={}, m2={}, min={}, max={})".format(
+            self.count, self.mean, self.m2, self.min, self.max)
+
+
+def _nanpropagating(func, a, b):
+    # min(inf, nan) es inf: el NaN se perderia segun el orden de los datos
+    return math.nan if math.isnan(a) or math.isnan(b) else func(a, b)
+
+
+def moments(source, chunksize=CHUNKSIZE, dtype=None, acc_dtype=np.float64):
+    """Calcula los momentos de ``source`` recorriendola una sola vez.
+
+    ``source`` puede ser un arreglo, una lista, un iterable de escalares o
+    un iterable de bloques (por ejemplo, lecturas de un archivo). ``dtype``
+    es el tipo en que se leen los bloques y ``acc_dtype`` el de los
+    acumuladores.
+
+    >>> epa = moments([27.3, 27.9, 32.9, 35.2, 44.9, 39.9, 30.0, 29.7, 28.5, 32.0, 37.6])
+    >>> round(float(epa.mean), 4), round(float(epa.var(ddof=1)), 4)
+    (33.2636, 31.4105)
+    """
+    acc = Moments(acc_dtype)
+    for chunk in iter_chunks(source, chunksize, dtype=dtype):
+        acc.update(chunk)
+    return acc
@@ -0,0 +1,119 @@
+"""Deteccion de valores atipicos con las cercas de Tukey en linea.
+
+Los cuartiles se mantienen en un ``KLLSketch``, de modo que las cercas
+
+    [Q1 - k * IQR, Q3 + k * IQR]
+
+se actualizan con cada bloque sin volver a ordenar los datos. Cada bloque
+se marca contra las cercas que incluyen ese bloque; con un solo bloque y
+``ExactQuantiles`` como estimador el resultado coincide con el de
+``ax.boxplot``.
+"""
+
+import numpy as np
+
+from ._chunks import CHUNKSIZE, iter_chunks
+from .moments import Moments
+from .sketch import KLLSketch
+
+
+class OutlierDetector:
+    """Marca valores fuera de las cercas de Tukey y resume la caja.
+
+    ``whis`` es el factor k de las cercas (1.5 por defecto, como en
+    matplotlib). Se guarda una muestra de a lo sumo ``max_fliers`` valores
+    atipicos para dibujarlos. ``n_outliers`` cuenta los valores marcados
+    con las cercas vigentes al llegar cada bloque, por lo que es solo una
+    estimacion del numero de atipicos respecto a las cercas finales.
+    """
+
+    def __init__(self, whis=1.5, sketch=None, max_fliers=1000, seed=None):
+        self.whis = whis
+        self.sketch = KLLSketch(seed=seed) if sketch is None else sketch
+        self.moments = Moments()
+        self.max_fliers = int(max_fliers)
+        self.n_outliers = 0
+        self._fliers = np.empty(0)
+        self._rng = np.random.default_rng(seed)
+
+    def fences(self):
+        """Cercas inferior y superior actuales."""
+        q1, q3 = np.atleast_1d(self.sketch.quantile([0.25, 0.75]))
+        iqr = q3 - q1
+        return q1 - self.whis * iqr, q3 + self.whis * iqr
+
+    def update(self, chunk):
+        """Agrega un bloque y retorna la mascara de sus valores atipicos."""
+        x = np.asarray(chunk, dtype=np.float64).reshape(-1)
+        if x.size == 0:
+            return np.zeros(0, dtype=bool)
+        self.sketch.update(x)
+        self.moments.update(x)
+        lo, hi = self.fences()
+        mask = (x < lo) | (x > hi)
+        flagged = x[mask]
+        if flagged.size:
+            self._keep_fliers(flagged)
+        return mask
+
+    def _keep_fliers(self, flagged):
+        # Muestreo ponderado (Efraimidis-Spirakis): cada valor de la muestra
+        # anterior representa seen / len(muestra) atipicos; los nuevos, uno
+        seen = self.n_outliers
+        self.n_outliers += flagged.size
+        pool = np.concatenate((self._fliers, flagged))
+        if pool.size <= self.max_fliers:
+            self._fliers = pool
+            return
+        weights = np.ones(pool.size)
+        if self._fliers.size:
+            weights[:self._fliers.size] = seen / self._fliers.size
+        keys = self._rng.random(pool.size) ** (1.0 / weights)
+        keep = np.argpartition(-keys, self.max_fliers - 1)[:self.max_fliers]
+        self._fliers = pool[keep]
+
+    def whisker_stats(self, label=None):
+        """Estadisticos de la caja en el formato de ``Axes.bxp``.
+
+        Los bigotes llegan al valor retenido mas extremo dentro de las
+        cercas; ``fliers`` es la muestra de atipicos, limitada en tamaño y
+        filtrada con los bigotes finales (cada bloque se marco con las
+        cercas de ese momento, que pueden ser mas estrechas).
+        """
+        q1, med, q3 = np.atleast_1d(self.sketch.quantile([0.25, 0.5, 0.75]))
+        lo, hi = self.fences()
+        kept = self.sketch.values()
+        inside = kept[(kept >= lo) & (kept <= hi)]
+        n = self.sketch.count
+        iqr = q3 - q1
+        whislo = inside.min() if inside.size else q1
+        whishi = inside.max() if inside.size else q3
+        fliers = self._fliers[(self._fliers < whislo) | (self._fliers > whishi)]
+        stats = {
+            "mean": self.moments.mean,
+            "med": med,
+            "q1": q1,
+            "q3": q3,
+            "iqr": iqr,
+            "cilo": med - 1.57 * iqr / np.sqrt(n),
+            "cihi": med + 1.57 * iqr / np.sqrt(n),
+            "whislo": whislo,
+            "whishi": whishi,
+            "fliers": np.sort(fliers),
+        }
+        if label is not None:
+            stats["label"] = label
+        return stats
+
+
+def detect(source, whis=1.5, chunksize=CHUNKSIZE, detector=None):
+    """Genera ``(indices, valores)`` de los atipicos de cada bloque de
+    ``source``, en el orden en que llegan."""
+    detector = OutlierDetector(whis) if detector is None else detector
+    offset = 0
+    for chunk in iter_chunks(source, chunksize):
+        mask = detector.update(chunk)
+        index = np.flatnonzero(mask)
+        if index.size:
+            yield index + offset, np.asarray(chunk)[index]
+        offset += mask.size
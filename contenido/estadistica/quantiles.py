@@ -0,0 +1,90 @@
+"""Varios cuantiles con una sola particion de los datos.
+
+``np.quantile`` llamado una vez por cuantil vuelve a particionar el arreglo
+completo en cada llamada. Aqui se reunen todos los estadisticos de orden
+necesarios y se pide a ``np.partition`` que los ubique en un solo llamado.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+QuantileSummary = namedtuple(
+    "QuantileSummary", ["quantiles", "min", "max", "range", "iqr"])
+
+# Posicion virtual (base 0) del cuantil q en n datos ordenados, segun los
+# metodos de interpolacion de ``np.quantile``. Los metodos discontinuos
+# (inverted_cdf, averaged_inverted_cdf, closest_observation) no se incluyen.
+_POSITIONS = {
+    "linear": lambda q, n: q * (n - 1),
+    "lower": lambda q, n: q * (n - 1),
+    "higher": lambda q, n: q * (n - 1),
+    "nearest": lambda q, n: q * (n - 1),
+    "midpoint": lambda q, n: q * (n - 1),
+    "interpolated_inverted_cdf": lambda q, n: n * q - 1,
+    "hazen": lambda q, n: n * q - 0.5,
+    "weibull": lambda q, n: (n + 1) * q - 1,
+    "median_unbiased": lambda q, n: (n + 1 / 3) * q - 2 / 3,
+    "normal_unbiased": lambda q, n: (n + 1 / 4) * q - 5 / 8,
+}
+
+
+def quantiles(data, qs, method="linear"):
+    """Calcula los cuantiles ``qs`` de ``data`` con un solo ``np.partition``.
+
+    Retorna un ``QuantileSummary`` con los cuantiles (en el orden de ``qs``),
+    el minimo, el maximo, el rango y el rango intercuartilico. ``method``
+    sigue los nombres de ``np.quantile``.
+
+    >>> profundidad = [40, 52, 55, 60, 70, 75, 85, 85, 90, 90, 92, 94, 94, 95, 98, 100, 115, 125, 125]
+    >>> r = quantiles(profundidad, [0, 0.25, 0.5, 0.75, 1])
+    >>> r.quantiles.tolist(), float(r.range), float(r.iqr)
+    ([40.0, 72.5, 90.0, 96.5, 125.0], 85.0, 24.0)
+    """
+    if method not in _POSITIONS:
+        raise ValueError("metodo de interpolacion no soportado: {}".format(method))
+    x = np.asarray(data).reshape(-1)
+    n = x.size
+    if n == 0:
+        raise ValueError("no se pueden calcular cuantiles de un arreglo vacio")
+    qs = np.asarray(qs, dtype=np.float64)
+    if np.any((qs < 0) | (qs > 1)):
+        raise ValueError("los cuantiles deben estar en [0, 1]")
+
+    # Los cuartiles se agregan siempre para poder reportar el IQR
+    allq = np.concatenate((qs.reshape(-1), [0.25, 0.75]))
+    pos = np.clip(_POSITIONS[method](allq, n), 0, n - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    kth = np.unique(np.concatenate((lo, hi, [0, n - 1])))
+    part = np.partition(x, kth)
+
+    frac = pos - lo
+    a, b = part[lo], part[hi]
+    if method == "lower":
+        values = a
+    elif method == "higher":
+        values = np.where(frac > 0, b, a)
+    elif method == "nearest":
+        # Empates a la mitad van al indice par, como en NumPy
+        up = (frac > 0.5) | ((frac == 0.5) & (lo % 2 == 1))
+        values = np.where(up, b, a)
+    elif method == "midpoint":
+        values = np.where(frac > 0, (a + b) / 2, a)
+    else:
+        values = a + (b - a) * frac
+
+    lowest, highest = part[0], part[n - 1]
+    return QuantileSummary(
+        quantiles=values[:-2].reshape(qs.shape),
+        min=lowest,
+        max=highest,
+        range=highest - lowest,
+        iqr=values[-1] - values[-2],
+    )
+
+
+def five_number(data, method="linear"):
+    """Resumen de los cinco numeros (Min, Q1, Mediana, Q3, Max) y el IQR."""
+    result = quantiles(data, [0.0, 0.25, 0.5, 0.75, 1.0], method=method)
+    return tuple(result.quantiles.tolist()) + (float(result.iqr),)
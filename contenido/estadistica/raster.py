@@ -0,0 +1,270 @@
+"""Dibujo de millones de puntos agregandolos en una grilla de pixeles.
+
+``ax.scatter`` y ``ax.plot`` crean un artista vectorial por punto; mas alla
+de unos 10^5 puntos el dibujo se vuelve lento y el archivo enorme. Aqui los
+puntos se asignan a los pixeles de un lienzo fijo con ``np.bincount`` y en
+cada pixel se guarda el conteo, la suma, el minimo o el maximo. La imagen
+resultante se colorea (lineal, logaritmica o con ecualizacion de
+histograma) y se muestra con ``imshow``: el costo del dibujo depende del
+tamaño del lienzo, no del numero de puntos.
+
+>>> r = Raster(4, 2, x_range=(0, 4), y_range=(0, 2))
+>>> r.update([0.5, 0.7, 3.5], [0.5, 0.2, 1.5]).to_numpy().tolist()
+[[2, 0, 0, 0], [0, 0, 0, 1]]
+"""
+
+import numpy as np
+
+from ._chunks import CHUNKSIZE, iter_chunks
+
+AGGREGATIONS = ("count", "sum", "mean", "min", "max")
+
+# Maximo de puntos intermedios que se generan a la vez al trazar segmentos
+_LINE_BUDGET = 1 << 22
+
+
+class Raster:
+    """Lienzo de ``width`` x ``height`` pixeles que acumula puntos.
+
+    ``agg`` define que se guarda en cada pixel: ``"count"`` (numero de
+    puntos) o la suma, media, minimo o maximo de ``values``. Los puntos
+    fuera de ``x_range`` o ``y_range`` se descartan.
+    """
+
+    def __init__(self, width, height, x_range, y_range, agg="count"):
+        if agg not in AGGREGATIONS:
+            raise ValueError("agregacion desconocida: {}".format(agg))
+        if x_range[1] <= x_range[0] or y_range[1] <= y_range[0]:
+            raise ValueError("los rangos deben ser crecientes")
+        self.width = int(width)
+        self.height = int(height)
+        self.x_range = (float(x_range[0]), float(x_range[1]))
+        self.y_range = (float(y_range[0]), float(y_range[1]))
+        self.agg = agg
+        size = self.width * self.height
+        self.count = np.zeros(size, dtype=np.int64)
+        if agg in ("sum", "mean"):
+            self.total = np.zeros(size)
+        elif agg == "min":
+            self.extreme = np.full(size, np.inf)
+        elif agg == "max":
+            self.extreme = np.full(size, -np.inf)
+
+    @property
+    def extent(self):
+        """Limites ``(x0, x1, y0, y1)`` para ``imshow``."""
+        return self.x_range + self.y_range
+
+    def _pixels(self, x, y):
+        # Coordenadas continuas en pixeles
+        px = (x - self.x_range[0]) * (self.width / (self.x_range[1] - self.x_range[0]))
+        py = (y - self.y_range[0]) * (self.height / (self.y_range[1] - self.y_range[0]))
+        return px, py
+
+    def _accumulate(self, px, py, values):
+        # El borde superior del rango se asigna al ultimo pixel
+        col = np.minimum(np.floor(px), self.width - 1)
+        row = np.minimum(np.floor(py), self.height - 1)
+        inside = (px >= 0) & (px <= self.width) & (py >= 0) & (py <= self.height)
+        index = row[inside].astype(np.intp) * self.width + col[inside].astype(np.intp)
+        size = self.count.size
+        self.count += np.bincount(index, minlength=size)
+        if self.agg == "count":
+            return
+        v = values[inside]
+        if self.agg in ("sum", "mean"):
+            self.total += np.bincount(index, weights=v, minlength=size)
+        elif self.agg == "min":
+            np.minimum.at(self.extreme, index, v)
+        else:
+            np.maximum.at(self.extreme, index, v)
+
+    def _values(self, values, size):
+        if self.agg == "count":
+            return None
+        if values is None:
+            raise ValueError("la agregacion '{}' necesita values".format(self.agg))
+        return np.asarray(values, dtype=np.float64).reshape(-1)[:size]
+
+    def update(self, x, y, values=None):
+        """Agrega los puntos ``(x, y)`` (y sus ``values``)."""
+        x = np.asarray(x, dtype=np.float64).reshape(-1)
+        y = np.asarray(y, dtype=np.float64).reshape(-1)
+        if x.shape != y.shape:
+            raise ValueError("x e y deben tener la misma longitud")
+        px, py = self._pixels(x, y)
+        self._accumulate(px, py, self._values(values, x.size))
+        return self
+
+    def update_line(self, x, y, values=None, endpoint=True):
+        """Agrega la linea poligonal que une los puntos ``(x, y)`` en orden.
+
+        Cada segmento se muestrea con un punto por pixel que atraviesa; en
+        los segmentos, ``values`` se interpola linealmente. Con
+        ``endpoint=False`` no se marca el ultimo punto, para continuar la
+        linea con otro bloque que empiece en el.
+        """
+        x = np.asarray(x, dtype=np.float64).reshape(-1)
+        y = np.asarray(y, dtype=np.float64).reshape(-1)
+        if x.shape != y.shape:
+            raise ValueError("x e y deben tener la misma longitud")
+        v = self._values(values, x.size)
+        px, py = self._pixels(x, y)
+        finite = np.isfinite(px) & np.isfinite(py)
+        # Los segmentos con un extremo no finito se omiten (cortes de la linea)
+        ok = finite[:-1] & finite[1:]
+        dx, dy = np.diff(px), np.diff(py)
+        # Longitud en pixeles, limitada para segmentos que salen del lienzo
+        length = np.minimum(np.maximum(np.abs(dx), np.abs(dy)),
+                            2 * (self.width + self.height))
+        steps = np.where(ok, np.maximum(np.ceil(length), 1), 0).astype(np.intp)
+        start = 0
+        ends = np.cumsum(steps)
+        while start < steps.size:
+            # Grupos de segmentos con a lo sumo _LINE_BUDGET puntos
+            base = ends[start - 1] if start else 0
+            stop = max(start + 1, int(np.searchsorted(ends, base + _LINE_BUDGET,
+                                                      side="right")))
+            seg = np.repeat(np.arange(start, stop), steps[start:stop])
+            first = np.repeat(ends[start:stop] - steps[start:stop],
+                              steps[start:stop])
+            t = (np.arange(base, ends[stop - 1]) - first) / steps[seg]
+            sx = px[seg] + t * dx[seg]
+            sy = py[seg] + t * dy[seg]
+            sv = None if v is None else v[seg] + t * (v[seg + 1] - v[seg])
+            self._accumulate(sx, sy, sv)
+            start = stop
+        # El ultimo punto de la linea
+        if endpoint and x.size and finite[-1]:
+            self._accumulate(px[-1:], py[-1:], None if v is None else v[-1:])
+        return self
+
+    def merge(self, other):
+        if (self.width, self.height, self.x_range, self.y_range, self.agg) != (
+                other.width, other.height, other.x_range, other.y_range, other.agg):
+            raise ValueError("los lienzos no son compatibles")
+        result = Raster(self.width, self.height, self.x_range, self.y_range, self.agg)
+        result.count = self.count + other.count
+        if self.agg in ("sum", "mean"):
+            result.total = self.total + other.total
+        elif self.agg == "min":
+            result.extreme = np.minimum(self.extreme, other.extreme)
+        elif self.agg == "max":
+            result.extreme = np.maximum(self.extreme, other.extreme)
+        return result
+
+    def to_numpy(self):
+        """Imagen agregada de ``height`` x ``width``; la fila 0 es la de
+        menor ``y``. Los pixeles vacios valen 0 en ``count`` y ``sum`` y
+        NaN en el resto."""
+        shape = (self.height, self.width)
+        if self.agg == "count":
+            return self.count.reshape(shape).copy()
+        if self.agg == "sum":
+            return self.total.reshape(shape).copy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            image = (self.total / self.count if self.agg == "mean"
+                     else np.where(self.count > 0, self.extreme, np.nan))
+        return image.reshape(shape)
+
+
+def rasterize(x, y, values=None, width=800, height=600, x_range=None,
+              y_range=None, agg="count", line=False, chunksize=CHUNKSIZE):
+    """Crea un ``Raster`` con los puntos (o la linea, si ``line``) dados.
+
+    Si no se dan los rangos se usan los extremos de los datos. ``x`` e
+    ``y`` se recorren por bloques, de modo que pueden ser ``np.memmap``.
+    """
+    if x_range is None or y_range is None:
+        (x0, x1), (y0, y1) = _extremes(x, chunksize), _extremes(y, chunksize)
+        x_range = (x0, x1) if x_range is None else x_range
+        y_range = (y0, y1) if y_range is None else y_range
+    raster = Raster(width, height, x_range, y_range, agg)
+    chunks = zip(iter_chunks(x, chunksize), iter_chunks(y, chunksize),
+                 iter_chunks(values, chunksize) if values is not None else _none())
+    if not line:
+        for cx, cy, cv in chunks:
+            raster.update(cx, cy, cv)
+        return raster
+    last = None
+    for cx, cy, cv in chunks:
+        if last is not None:
+            # Cada bloque empieza en el ultimo punto del anterior para no
+            # cortar la linea
+            cx, cy = np.concatenate(([last[0]], cx)), np.concatenate(([last[1]], cy))
+            if cv is not None:
+                cv = np.concatenate(([last[2]], cv))
+        raster.update_line(cx, cy, cv, endpoint=False)
+        if cx.size:
+            last = (cx[-1], cy[-1], None if cv is None else cv[-1])
+    if last is not None:
+        raster.update(last[:1], last[1:2], None if last[2] is None else last[2:])
+    return raster
+
+
+def _none():
+    while True:
+        yield None
+
+
+def _extremes(source, chunksize):
+    lo, hi = np.inf, -np.inf
+    for chunk in iter_chunks(source, chunksize, dtype=np.float64):
+        finite = chunk[np.isfinite(chunk)]
+        if finite.size:
+            lo, hi = min(lo, finite.min()), max(hi, finite.max())
+    if not np.isfinite(lo):
+        raise ValueError("no hay datos finitos")
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    return lo, hi
+
+
+def shade(image, cmap="viridis", how="eq_hist", empty=None):
+    """Colorea ``image`` y retorna un arreglo RGBA de ``uint8``.
+
+    ``how`` es ``"linear"``, ``"log"`` o ``"eq_hist"`` (ecualizacion de
+    histograma, que reparte los colores segun el rango de cada pixel y
+    hace visibles a la vez las zonas densas y las escasas). Los pixeles
+    vacios quedan transparentes: los marcados en ``empty`` o, si no se da,
+    los NaN y, en imagenes enteras (conteos), los 0. En una imagen de
+    reales un 0 es un valor como cualquier otro.
+    """
+    import matplotlib
+
+    image = np.asarray(image)
+    if empty is None:
+        empty = image == 0 if image.dtype.kind in "biu" else np.zeros(image.shape, bool)
+    image = image.astype(np.float64)
+    filled = np.isfinite(image) & ~np.asarray(empty, dtype=bool)
+    values = image[filled]
+    norm = np.zeros_like(image)
+    if values.size:
+        if how == "linear":
+            scaled = values
+        elif how == "log":
+            scaled = np.log1p(values - values.min())
+        elif how == "eq_hist":
+            ordered = np.sort(values)
+            scaled = np.searchsorted(ordered, values, side="right")
+        else:
+            raise ValueError("escala desconocida: {}".format(how))
+        lo, hi = scaled.min(), scaled.max()
+        norm[filled] = (scaled - lo) / (hi - lo) if hi > lo else 1.0
+    rgba = matplotlib.colormaps[cmap](norm, bytes=True)
+    rgba[~filled, 3] = 0
+    return rgba
+
+
+def imshow(raster, ax=None, cmap="viridis", how="eq_hist", **kwargs):
+    """Muestra un ``Raster`` con ``ax.imshow`` en las coordenadas de los
+    datos. ``kwargs`` se pasan a ``imshow``."""
+    if ax is None:
+        import matplotlib.pyplot as plt
+        ax = plt.gca()
+    kwargs.setdefault("aspect", "auto")
+    kwargs.setdefault("interpolation", "nearest")
+    # Vacios son los pixeles sin puntos, aunque la suma valga 0
+    empty = raster.count.reshape(raster.height, raster.width) == 0
+    return ax.imshow(shade(raster.to_numpy(), cmap, how, empty), origin="lower",
+                     extent=raster.extent, **kwargs)
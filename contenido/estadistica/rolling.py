@@ -0,0 +1,379 @@
+"""Medidas de dispersion sobre una ventana deslizante.
+
+Cada dato nuevo actualiza la ventana sin recorrerla completa:
+
+* media y varianza: Welford al agregar y al retirar un dato, O(1);
+* minimo, maximo y rango: colas monotonas, O(1) amortizado;
+* mediana, cuantiles, IQR y desviacion media absoluta: lista de saltos
+  indexable (skip list) con sumas por enlace, O(log w) esperado.
+
+Para arreglos completos, ``rolling`` calcula media, varianza y extremos
+de todas las ventanas a la vez con NumPy (sumas acumuladas y el algoritmo
+de van Herk / Gil-Werman) y solo recorre los datos uno a uno si se piden
+estadisticos de orden. Como en ``Series.rolling``, los valores no finitos
+(NaN, inf) ocupan su lugar en la ventana pero no se usan.
+"""
+
+import math
+import random
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+STATS = ("mean", "var", "std", "min", "max", "range",
+         "median", "q1", "q3", "iqr", "mad")
+
+# Estadisticos que necesitan las colas monotonas o la lista de saltos
+_EXTREMA = ("min", "max", "range")
+_ORDER = ("median", "q1", "q3", "iqr", "mad")
+
+# Datos por bloque en las sumas acumuladas de ``rolling``; cada bloque se
+# centra en su propia media para evitar la cancelacion en la varianza
+_BLOCK = 1 << 16
+
+
+class _Node:
+    __slots__ = ("value", "next", "width", "sums")
+
+    def __init__(self, value, levels):
+        self.value = value
+        self.next = [None] * levels
+        self.width = [0] * levels
+        self.sums = [0.0] * levels
+
+
+class _SkipList:
+    """Lista de saltos ordenada e indexable por rango.
+
+    Cada enlace guarda cuantos nodos salta (``width``) y la suma de sus
+    valores (``sums``), de modo que el k-esimo valor y la suma de los k
+    menores se obtienen en O(log n).
+    """
+
+    def __init__(self, expected_size):
+        self.levels = max(1, int(1 + math.log2(max(expected_size, 2))))
+        self.size = 0
+        self._nil = _Node(math.inf, 0)
+        self.head = _Node(-math.inf, self.levels)
+        self.head.next = [self._nil] * self.levels
+        self.head.width = [1] * self.levels
+        self._random = random.Random(0)
+
+    def insert(self, value):
+        chain = [None] * self.levels
+        steps = [0] * self.levels
+        sums = [0.0] * self.levels
+        node = self.head
+        for level in reversed(range(self.levels)):
+            while node.next[level].value <= value:
+                steps[level] += node.width[level]
+                sums[level] += node.sums[level]
+                node = node.next[level]
+            chain[level] = node
+
+        d = min(self.levels, 1 - int(math.log2(1.0 - self._random.random())))
+        new = _Node(value, d)
+        step, total = 0, 0.0
+        for level in range(d):
+            prev = chain[level]
+            new.next[level] = prev.next[level]
+            prev.next[level] = new
+            new.width[level] = prev.width[level] - step
+            new.sums[level] = prev.sums[level] - total
+            prev.width[level] = step + 1
+            prev.sums[level] = total + value
+            step += steps[level]
+            total += sums[level]
+        for level in range(d, self.levels):
+            chain[level].width[level] += 1
+            chain[level].sums[level] += value
+        self.size += 1
+
+    def remove(self, value):
+        chain = [None] * self.levels
+        node = self.head
+        for level in reversed(range(self.levels)):
+            while node.next[level].value < value:
+                node = node.next[level]
+            chain[level] = node
+        target = chain[0].next[0]
+        if target.value != value:
+            raise KeyError(value)
+        d = len(target.next)
+        for level in range(d):
+            prev = chain[level]
+            prev.width[level] += target.width[level] - 1
+            prev.sums[level] += target.sums[level] - value
+            prev.next[level] = target.next[level]
+        for level in range(d, self.levels):
+            chain[level].width[level] -= 1
+            chain[level].sums[level] -= value
+        self.size -= 1
+
+    def __getitem__(self, i):
+        """Valor de rango ``i`` (base 0)."""
+        node = self.head
+        i += 1
+        for level in reversed(range(self.levels)):
+            while node.width[level] <= i:
+                i -= node.width[level]
+                node = node.next[level]
+        return node.value
+
+    def below(self, value):
+        """Cantidad y suma de los valores menores que ``value``."""
+        node = self.head
+        count, total = 0, 0.0
+        for level in reversed(range(self.levels)):
+            while node.next[level].value < value:
+                count += node.width[level]
+                total += node.sums[level]
+                node = node.next[level]
+        return count, total
+
+
+class RollingWindow:
+    """Ventana deslizante con las ultimas ``window`` observaciones.
+
+    Solo se construyen las estructuras que necesitan ``stats``: las colas
+    monotonas para los extremos y la lista de saltos para los estadisticos
+    de orden. Los valores no finitos ocupan su lugar en la ventana pero no
+    se cuentan en ``count``.
+    """
+
+    def __init__(self, window, stats=STATS):
+        if window < 1:
+            raise ValueError("la ventana debe tener al menos un dato")
+        self.window = int(window)
+        self._values = deque()
+        self._index = 0
+        extrema = any(name in _EXTREMA for name in stats)
+        self._mins = deque() if extrema else None
+        self._maxs = deque() if extrema else None
+        order = any(name in _ORDER for name in stats)
+        self._sorted = _SkipList(self.window) if order else None
+        self._total = 0.0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, x):
+        """Agrega ``x`` y retira el dato mas antiguo si la ventana esta llena."""
+        x = float(x)
+        if len(self._values) == self.window:
+            self._pop()
+        self._values.append(x)
+        i = self._index
+        self._index += 1
+        if not math.isfinite(x):
+            return self
+        self._total += x
+
+        # Welford: agregar
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+        if self._sorted is not None:
+            self._sorted.insert(x)
+        if self._mins is not None:
+            while self._mins and self._mins[-1][1] >= x:
+                self._mins.pop()
+            self._mins.append((i, x))
+            while self._maxs and self._maxs[-1][1] <= x:
+                self._maxs.pop()
+            self._maxs.append((i, x))
+        return self
+
+    def _pop(self):
+        oldest = self._index - len(self._values)
+        x = self._values.popleft()
+        if not math.isfinite(x):
+            return
+        self._total -= x
+
+        # Welford: retirar
+        self.count -= 1
+        if self.count == 0:
+            self.mean = self.m2 = 0.0
+        else:
+            delta = x - self.mean
+            self.mean -= delta / self.count
+            self.m2 = max(self.m2 - delta * (x - self.mean), 0.0)
+
+        if self._sorted is not None:
+            self._sorted.remove(x)
+        if self._mins is not None:
+            if self._mins[0][0] == oldest:
+                self._mins.popleft()
+            if self._maxs[0][0] == oldest:
+                self._maxs.popleft()
+
+    def _require(self, structure, name):
+        if structure is None:
+            raise ValueError("la ventana no se creo para calcular {}".format(name))
+
+    def var(self, ddof=0):
+        if self.count - ddof <= 0:
+            return math.nan
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=0):
+        return math.sqrt(self.var(ddof))
+
+    def min(self):
+        self._require(self._mins, "min")
+        return self._mins[0][1] if self.count else math.nan
+
+    def max(self):
+        self._require(self._maxs, "max")
+        return self._maxs[0][1] if self.count else math.nan
+
+    def range(self):
+        return self.max() - self.min()
+
+    def quantile(self, q):
+        """Cuantil ``q`` de la ventana con interpolacion lineal."""
+        self._require(self._sorted, "cuantiles")
+        if self.count == 0:
+            return math.nan
+        pos = q * (self.count - 1)
+        lo = int(math.floor(pos))
+        a = self._sorted[lo]
+        if lo + 1 >= self.count:
+            return a
+        return a + (self._sorted[lo + 1] - a) * (pos - lo)
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def iqr(self):
+        return self.quantile(0.75) - self.quantile(0.25)
+
+    def mad(self):
+        """Desviacion media absoluta respecto a la media de la ventana."""
+        self._require(self._sorted, "mad")
+        if self.count == 0:
+            return math.nan
+        m = self.mean
+        below, sum_below = self._sorted.below(m)
+        above = self.count - below
+        sum_above = self._total - sum_below
+        return (m * below - sum_below + sum_above - m * above) / self.count
+
+    def stat(self, name, ddof=0):
+        if name == "mean":
+            return self.mean if self.count else math.nan
+        if name in ("var", "std"):
+            return getattr(self, name)(ddof)
+        if name == "q1":
+            return self.quantile(0.25)
+        if name == "q3":
+            return self.quantile(0.75)
+        if name in STATS:
+            return getattr(self, name)()
+        raise ValueError("estadistico desconocido: {}".format(name))
+
+
+def rolling(data, window, stats=("mean", "std", "range", "median", "iqr"),
+            ddof=1, min_periods=None):
+    """Calcula ``stats`` sobre cada ventana de ``window`` datos de ``data``.
+
+    Retorna un ``DataFrame`` con una columna por estadistico. Como en
+    ``Series.rolling``, una fila queda en NaN si su ventana tiene menos de
+    ``min_periods`` valores finitos (por defecto, ``window``).
+    """
+    for name in stats:
+        if name not in STATS:
+            raise ValueError("estadistico desconocido: {}".format(name))
+    window = int(window)
+    if window < 1:
+        raise ValueError("la ventana debe tener al menos un dato")
+    min_periods = window if min_periods is None else max(int(min_periods), 1)
+    x = np.asarray(data, dtype=np.float64).reshape(-1)
+    valid = np.isfinite(x)
+    # Se anteponen window - 1 datos faltantes para que todas las ventanas
+    # tengan el mismo largo
+    padded = np.concatenate((np.full(window - 1, np.nan), x))
+    count = _window_sums(valid.astype(np.int64), window)
+    enough = count >= min_periods
+
+    columns = {}
+    if any(name in ("mean", "var", "std") for name in stats):
+        mean, m2 = _window_moments(padded, window)
+        columns["mean"] = mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = np.where(count - ddof > 0, m2 / (count - ddof), np.nan)
+        columns["var"] = var
+        columns["std"] = np.sqrt(var)
+    if any(name in _EXTREMA for name in stats):
+        columns["min"] = -_window_max(np.where(np.isfinite(padded), -padded, -np.inf), window)
+        columns["max"] = _window_max(np.where(np.isfinite(padded), padded, -np.inf), window)
+        columns["range"] = columns["max"] - columns["min"]
+    order = [name for name in stats if name in _ORDER]
+    if order:
+        acc = RollingWindow(window, stats=order)
+        values = np.full((x.size, len(order)), np.nan)
+        for i, value in enumerate(x.tolist()):
+            acc.push(value)
+            if acc.count >= min_periods:
+                values[i] = [acc.stat(name, ddof) for name in order]
+        columns.update(zip(order, values.T))
+
+    out = np.column_stack([columns[name] for name in stats]) if stats else \
+        np.empty((x.size, 0))
+    out[~enough] = np.nan
+    index = data.index if isinstance(data, pd.Series) else None
+    return pd.DataFrame(out, columns=list(stats), index=index)
+
+
+def _window_sums(x, window):
+    """Suma de cada ventana de ``window`` datos que termina en cada
+    posicion (las primeras ventanas son parciales)."""
+    total = np.cumsum(x)
+    total[window:] = total[window:] - total[:-window]
+    return total
+
+
+def _window_moments(padded, window):
+    """Media y suma de cuadrados de desviaciones de cada ventana completa
+    de ``padded``, ignorando los valores no finitos."""
+    n = padded.size - window + 1
+    mean = np.empty(n)
+    m2 = np.empty(n)
+    for start in range(0, n, _BLOCK):
+        stop = min(start + _BLOCK, n)
+        # Datos de las ventanas que terminan en [start, stop)
+        part = padded[start:stop + window - 1]
+        valid = np.isfinite(part)
+        ref = part[valid].mean() if valid.any() else 0.0
+        dev = np.where(valid, part - ref, 0.0)
+        s0 = np.concatenate(([0], np.cumsum(valid)))
+        s1 = np.concatenate(([0.0], np.cumsum(dev)))
+        s2 = np.concatenate(([0.0], np.cumsum(dev * dev)))
+        k = (s0[window:] - s0[:-window]).astype(np.float64)
+        d1 = s1[window:] - s1[:-window]
+        d2 = s2[window:] - s2[:-window]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean[start:stop] = np.where(k > 0, ref + d1 / k, np.nan)
+            m2[start:stop] = np.maximum(d2 - d1 * d1 / k, 0.0)
+    return mean, m2
+
+
+def _window_max(padded, window):
+    """Maximo de cada ventana completa de ``padded`` en O(n) vectorizado
+    (van Herk / Gil-Werman): maximos acumulados hacia adelante y hacia
+    atras dentro de bloques de ``window`` datos."""
+    n = padded.size - window + 1
+    blocks = -(-padded.size // window)
+    full = np.full(blocks * window, -np.inf)
+    full[:padded.size] = padded
+    rows = full.reshape(blocks, window)
+    forward = np.maximum.accumulate(rows, axis=1).reshape(-1)
+    backward = np.maximum.accumulate(rows[:, ::-1], axis=1)[:, ::-1].reshape(-1)
+    result = np.maximum(backward[:n], forward[window - 1:window - 1 + n])
+    # Ventanas sin datos finitos
+    result[np.isneginf(result)] = np.nan
+    return result
@@ -0,0 +1,173 @@
+"""Estructuras para estimar cuantiles de datos que llegan por bloques."""
+
+import math
+
+import numpy as np
+
+
+class _QuantileQueries:
+    """Consultas comunes a partir de ``quantile``."""
+
+    def five_number(self):
+        """Resumen de los cinco numeros: (Min, Q1, Mediana, Q3, Max)."""
+        return tuple(float(v) for v in
+                     np.atleast_1d(self.quantile([0.0, 0.25, 0.5, 0.75, 1.0])))
+
+    def iqr(self):
+        """Rango intercuartilico Q3 - Q1."""
+        q1, q3 = np.atleast_1d(self.quantile([0.25, 0.75]))
+        return float(q3 - q1)
+
+
+class ExactQuantiles(_QuantileQueries):
+    """Guarda todos los datos y calcula cuantiles exactos.
+
+    Sirve como referencia y para conjuntos pequeños; la memoria crece con
+    el numero de datos.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self.count = 0
+
+    def update(self, chunk):
+        x = np.asarray(chunk, dtype=np.float64).reshape(-1)
+        if x.size:
+            self._chunks.append(x.copy())
+            self.count += x.size
+        return self
+
+    def merge(self, other):
+        result = ExactQuantiles()
+        result._chunks = self._chunks + other._chunks
+        result.count = self.count + other.count
+        return result
+
+    def values(self):
+        if not self._chunks:
+            return np.empty(0)
+        if len(self._chunks) > 1:
+            self._chunks = [np.concatenate(self._chunks)]
+        return self._chunks[0]
+
+    def quantile(self, q):
+        """Cuantil(es) ``q`` con la interpolacion lineal de ``np.quantile``."""
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan)[()]
+        return np.quantile(self.values(), q)
+
+
+class KLLSketch(_QuantileQueries):
+    """Sketch de cuantiles KLL (Karnin, Lang y Liberty, 2016).
+
+    Guarda O(k log(n/k)) valores sin importar cuantos datos se agreguen. El
+    error en rango de cada cuantil es aproximadamente ``rank_error`` (con
+    k=200, cerca de 1.7% de n); mientras se hayan agregado a lo sumo ``k``
+    datos no hay compactacion y los cuantiles son exactos. El minimo y el
+    maximo siempre son exactos.
+    """
+
+    # Razon entre la capacidad de un nivel y la del nivel superior
+    _C = 2.0 / 3.0
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k debe ser al menos 8")
+        self.k = int(k)
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def for_error(cls, eps, seed=None):
+        """Crea un sketch cuyo error en rango es aproximadamente ``eps``."""
+        k = math.ceil((2.446 / eps) ** (1 / 0.9433))
+        return cls(k=max(k, 8), seed=seed)
+
+    @property
+    def rank_error(self):
+        # Aproximacion empirica del error en rango (DataSketches)
+        return 2.446 / self.k ** 0.9433
+
+    @property
+    def exact(self):
+        """Verdadero si aun no se ha compactado ningun nivel."""
+        return len(self._levels) == 1
+
+    def nbytes(self):
+        return sum(level.nbytes for level in self._levels)
+
+    def values(self):
+        """Valores retenidos (sin pesos), incluidos el minimo y el maximo."""
+        if self.count == 0:
+            return np.empty(0)
+        return np.concatenate([[self.min]] + self._levels + [[self.max]])
+
+    def update(self, chunk):
+        x = np.asarray(chunk, dtype=np.float64).reshape(-1)
+        if x.size == 0:
+            return self
+        self.count += x.size
+        self.min = min(self.min, float(x.min()))
+        self.max = max(self.max, float(x.max()))
+        self._levels[0] = np.concatenate((self._levels[0], x))
+        self._compress()
+        return self
+
+    def merge(self, other):
+        result = KLLSketch(min(self.k, other.k))
+        result._rng = self._rng
+        result.count = self.count + other.count
+        result.min = min(self.min, other.min)
+        result.max = max(self.max, other.max)
+        depth = max(len(self._levels), len(other._levels))
+        result._levels = [
+            np.concatenate((_level(self._levels, h), _level(other._levels, h)))
+            for h in range(depth)
+        ]
+        result._compress()
+        return result
+
+    def _capacity(self, h):
+        depth = len(self._levels)
+        return max(2, math.ceil(self.k * self._C ** (depth - 1 - h)))
+
+    def _compress(self):
+        while sum(map(len, self._levels)) > sum(
+                self._capacity(h) for h in range(len(self._levels))):
+            h = next(h for h, level in enumerate(self._levels)
+                     if len(level) >= self._capacity(h))
+            level = np.sort(self._levels[h])
+            # Con longitud impar, un elemento se queda en el nivel
+            keep = level[:len(level) % 2]
+            even = level[len(level) % 2:]
+            promoted = even[self._rng.integers(2)::2]
+            if h + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+            self._levels[h] = keep
+            self._levels[h + 1] = np.concatenate((self._levels[h + 1], promoted))
+
+    def quantile(self, q):
+        """Cuantil(es) ``q`` aproximados (exactos si ``exact``)."""
+        q = np.asarray(q, dtype=np.float64)
+        if self.count == 0:
+            return np.full(q.shape, np.nan)[()]
+        if self.exact:
+            return np.quantile(self._levels[0], q)
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h)
+                                  for h, level in enumerate(self._levels)])
+        order = np.argsort(items, kind="stable")
+        items, weights = items[order], weights[order]
+        # Rango central de cada elemento, en la escala 0..n-1 de np.quantile
+        centers = np.cumsum(weights) - weights / 2 - 0.5
+        centers = np.concatenate(([0.0], centers, [self.count - 1.0]))
+        items = np.concatenate(([self.min], items, [self.max]))
+        return np.interp(q * (self.count - 1), np.clip(centers, 0, self.count - 1),
+                         items)[()]
+
+
+def _level(levels, h):
+    return levels[h] if h < len(levels) else np.empty(0)
@@ -0,0 +1,150 @@
+"""Almacen columnar en disco respaldado por ``np.memmap``.
+
+Cada columna se guarda como un archivo binario con los valores contiguos
+y un manifiesto (``manifest.json``) registra su tipo y longitud. Al leer,
+las columnas se abren como ``np.memmap`` de solo lectura: las funciones del
+paquete las recorren por bloques sin copiarlas a memoria, de modo que la
+memoria residente no crece con el tamaño del archivo.
+
+>>> import tempfile
+>>> store = ColumnStore(tempfile.mkdtemp())
+>>> store.write("profundidad", [40, 52, 55, 60, 70, 75, 85, 85, 90])
+>>> store.columns, len(store["profundidad"])
+(['profundidad'], 9)
+"""
+
+import json
+import os
+
+import numpy as np
+
+from ._chunks import CHUNKSIZE, iter_chunks
+
+# Tipos que se pueden guardar como valores binarios contiguos: booleanos,
+# enteros, reales, complejos y fechas
+_KINDS = "biufcmM"
+
+
+class ColumnStore:
+    """Directorio con una columna por archivo y un manifiesto."""
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        os.makedirs(self.path, exist_ok=True)
+        manifest = os.path.join(self.path, self.MANIFEST)
+        if os.path.exists(manifest):
+            with open(manifest) as f:
+                self._manifest = json.load(f)
+        else:
+            self._manifest = {"columns": {}}
+
+    @classmethod
+    def from_frame(cls, path, frame, chunksize=CHUNKSIZE, errors="raise"):
+        """Crea un almacen con las columnas de un ``DataFrame``.
+
+        Las columnas que no son numericas (objetos, cadenas, categoricas)
+        o cuyo nombre no sirve como archivo producen un error antes de
+        escribir nada; con ``errors="skip"`` se omiten.
+        """
+        if errors not in ("raise", "skip"):
+            raise ValueError("errors debe ser 'raise' o 'skip'")
+        columns, invalid = [], []
+        for name in frame.columns:
+            values = frame[name].to_numpy()
+            try:
+                _check_name(str(name))
+                _check_dtype(values.dtype, name)
+            except (TypeError, ValueError) as error:
+                invalid.append(str(error))
+                continue
+            columns.append((str(name), values))
+        if invalid and errors == "raise":
+            raise ValueError("columnas que no se pueden guardar:\n"
+                             + "\n".join(invalid))
+        store = cls(path)
+        for name, values in columns:
+            store.write(name, values, chunksize=chunksize)
+        return store
+
+    @property
+    def columns(self):
+        return list(self._manifest["columns"])
+
+    def __contains__(self, name):
+        return name in self._manifest["columns"]
+
+    def write(self, name, source, dtype=None, chunksize=CHUNKSIZE):
+        """Escribe la columna ``name`` a partir de ``source`` por bloques.
+
+        ``source`` puede ser cualquier fuente aceptada por el paquete:
+        arreglos, listas, iterables de escalares o de bloques. Sin
+        ``dtype``, el tipo lo fija el primer bloque y los siguientes deben
+        poder convertirse a el sin perdida (``np.can_cast`` seguro).
+        """
+        _check_name(name)
+        filename = name + ".bin"
+        path = os.path.join(self.path, filename)
+        tmp = path + ".tmp"
+        length, kind = 0, None
+        try:
+            with open(tmp, "wb") as f:
+                for chunk in iter_chunks(source, chunksize, dtype=dtype):
+                    if kind is None:
+                        kind = chunk.dtype
+                        _check_dtype(kind, name)
+                    elif not np.can_cast(chunk.dtype, kind, "safe"):
+                        raise TypeError(
+                            "columna {!r}: un bloque de tipo {} no se puede guardar "
+                            "sin perdida como {}; indique dtype".format(
+                                name, chunk.dtype, kind))
+                    np.ascontiguousarray(chunk, dtype=kind).tofile(f)
+                    length += chunk.size
+            if kind is None:
+                # Sin bloques: el tipo declarado o el del arreglo vacio
+                if dtype is not None:
+                    kind = np.dtype(dtype)
+                elif isinstance(source, np.ndarray) or hasattr(source, "to_numpy"):
+                    kind = np.asarray(source).dtype
+                else:
+                    kind = np.dtype(np.float64)
+                _check_dtype(kind, name)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        os.replace(tmp, path)
+        self._manifest["columns"][name] = {
+            "file": filename, "dtype": kind.str, "length": length}
+        self._save()
+
+    def __getitem__(self, name):
+        """Columna ``name`` como ``np.memmap`` de solo lectura."""
+        info = self._manifest["columns"][name]
+        dtype = np.dtype(info["dtype"])
+        if info["length"] == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(os.path.join(self.path, info["file"]), dtype=dtype,
+                         mode="r", shape=(info["length"],))
+
+    def chunks(self, name, chunksize=CHUNKSIZE):
+        """Bloques de la columna ``name`` (vistas sobre el archivo)."""
+        return iter_chunks(self[name], chunksize)
+
+    def _save(self):
+        manifest = os.path.join(self.path, self.MANIFEST)
+        tmp = manifest + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self._manifest, f, indent=2)
+        os.replace(tmp, manifest)
+
+
+def _check_name(name):
+    if not name or name in (".", "..") or "/" in name or "\\" in name:
+        raise ValueError("nombre de columna no valido: {!r}".format(name))
+
+
+def _check_dtype(dtype, name):
+    if np.dtype(dtype).kind not in _KINDS:
+        raise TypeError("columna {!r}: el tipo {} no se puede guardar; solo "
+                        "tipos numericos, booleanos o fechas".format(name, dtype))
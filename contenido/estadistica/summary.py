@@ -0,0 +1,102 @@
+"""Resumenes combinables para ``describe()`` en paralelo.
+
+Cada particion de los datos se resume por separado (por ejemplo, en un
+pool de procesos) y los resumenes se combinan con ``merge``, que es
+asociativa: el resultado no depende del orden en que se combinen.
+
+Cotas de error respecto a ``DataFrame.describe()``: los valores faltantes
+(``NaN``) se omiten igual que en pandas, y tambien los infinitos, que
+pandas si cuenta. Sobre los demas datos el conteo, el minimo y el maximo
+son exactos; la media y la desviacion estandar difieren solo por redondeo
+de punto flotante; los cuantiles tienen el error del estimador de
+cuantiles usado. Con el ``KLLSketch`` por defecto (k=200) el rango de cada
+cuantil se desvia cerca de 1.7% de n y es exacto hasta 200 datos;
+``ExactQuantiles`` da cuantiles exactos a cambio de guardar todos los datos.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+
+import numpy as np
+import pandas as pd
+
+from ._chunks import CHUNKSIZE, drop_nonfinite, iter_chunks
+from .moments import Moments
+from .sketch import KLLSketch
+
+
+class ColumnSummary:
+    """Resumen de una columna: conteo, momentos, extremos y cuantiles."""
+
+    def __init__(self, sketch=None, acc_dtype=np.float64):
+        self.moments = Moments(acc_dtype)
+        self.sketch = KLLSketch() if sketch is None else sketch
+
+    def update(self, chunk):
+        # Los faltantes no se cuentan, como en pandas; tampoco los infinitos
+        x = drop_nonfinite(np.asarray(chunk).reshape(-1))
+        self.moments.update(x)
+        self.sketch.update(x)
+        return self
+
+    def merge(self, other):
+        """Combina dos resumenes y retorna uno nuevo."""
+        result = ColumnSummary.__new__(ColumnSummary)
+        result.moments = self.moments.merge(other.moments)
+        result.sketch = self.sketch.merge(other.sketch)
+        return result
+
+    @property
+    def count(self):
+        return self.moments.count
+
+    @property
+    def mean(self):
+        return self.moments.mean if self.count else np.nan
+
+    def std(self, ddof=1):
+        return self.moments.std(ddof)
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    def describe(self, percentiles=(0.25, 0.5, 0.75), name=None):
+        """Serie con los mismos campos que ``DataFrame.describe()``."""
+        index = ["count", "mean", "std", "min"]
+        values = [self.count, self.mean, self.std(),
+                  self.moments.min if self.count else np.nan]
+        quants = np.atleast_1d(self.quantile(list(percentiles)))
+        for p, value in zip(percentiles, quants):
+            index.append("{:g}%".format(100 * p))
+            values.append(value)
+        index.append("max")
+        values.append(self.moments.max if self.count else np.nan)
+        return pd.Series(values, index=index, name=name, dtype=np.float64)
+
+
+def summarize(source, chunksize=CHUNKSIZE, sketch=KLLSketch, dtype=None,
+              acc_dtype=np.float64):
+    """Resume ``source`` recorriendola por bloques.
+
+    ``sketch`` es la clase (o funcion) que crea el estimador de cuantiles;
+    ``dtype`` y ``acc_dtype`` son como en ``moments``.
+    """
+    summary = ColumnSummary(sketch(), acc_dtype)
+    for chunk in iter_chunks(source, chunksize, dtype=dtype):
+        summary.update(chunk)
+    return summary
+
+
+def summarize_parallel(partitions, max_workers=None, chunksize=CHUNKSIZE,
+                       sketch=KLLSketch, dtype=None, acc_dtype=np.float64):
+    """Resume cada particion en un proceso distinto y combina los resultados.
+
+    ``partitions`` es un iterable de fuentes que se puedan enviar a otro
+    proceso (arreglos, listas o, por ejemplo, ``np.memmap``); ``dtype`` y
+    ``acc_dtype`` son como en ``summarize``.
+    """
+    work = partial(summarize, chunksize=chunksize, sketch=sketch, dtype=dtype,
+                   acc_dtype=acc_dtype)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        parts = list(pool.map(work, partitions))
+    return reduce(ColumnSummary.merge, parts, ColumnSummary(sketch(), acc_dtype))
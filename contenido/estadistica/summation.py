@@ -0,0 +1,82 @@
+"""Sumas precisas para datos guardados con poca precision.
+
+Guardar los datos como ``float32`` (o ``float16``) reduce a la mitad (o a
+la cuarta parte) la memoria, pero sumar en esa misma precision acumula un
+error que crece con n. Aqui los datos se quedan en su tipo de
+almacenamiento y solo el acumulador usa un tipo mas amplio:
+
+* ``pairwise_sum``: suma por parejas dentro de un bloque, error O(log n);
+* ``CompensatedSum``: suma de Kahan-Neumaier entre bloques o valores
+  sueltos, error independiente de n.
+"""
+
+import numpy as np
+
+from ._chunks import CHUNKSIZE, iter_chunks
+
+# Tamaño de los bloques que se suman directamente en ``pairwise_sum``
+_BLOCK = 8192
+
+
+def pairwise_sum(x, dtype=np.float64):
+    """Suma por parejas de un arreglo 1-D acumulando en ``dtype``.
+
+    El arreglo no se convierte completo a ``dtype``: se suma por bloques y
+    luego se suman, tambien por parejas, los resultados de los bloques.
+    """
+    x = np.asarray(x).reshape(-1)
+    while x.size > _BLOCK:
+        whole = x.size - x.size % _BLOCK
+        sums = np.add.reduce(x[:whole].reshape(-1, _BLOCK), axis=1, dtype=dtype)
+        if whole < x.size:
+            sums = np.append(sums, np.add.reduce(x[whole:], dtype=dtype))
+        x = sums
+    return np.add.reduce(x, dtype=dtype)
+
+
+class CompensatedSum:
+    """Acumulador con compensacion de Kahan-Neumaier."""
+
+    __slots__ = ("total", "compensation")
+
+    def __init__(self, dtype=np.float64):
+        self.total = dtype(0)
+        self.compensation = dtype(0)
+
+    def add(self, value):
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self.compensation += (self.total - total) + value
+        else:
+            self.compensation += (value - total) + self.total
+        self.total = total
+        return self
+
+    def add_chunk(self, chunk):
+        """Suma un bloque (por parejas) y agrega el resultado."""
+        return self.add(pairwise_sum(chunk, type(self.total)))
+
+    def merge(self, other):
+        result = CompensatedSum(type(self.total))
+        result.total, result.compensation = self.total, self.compensation
+        result.add(other.total)
+        result.compensation += other.compensation
+        return result
+
+    @property
+    def value(self):
+        return self.total + self.compensation
+
+
+def compensated_sum(source, dtype=None, acc_dtype=np.float64, chunksize=CHUNKSIZE):
+    """Suma de ``source`` por bloques, con los datos en ``dtype`` (tipo de
+    almacenamiento) y el acumulador en ``acc_dtype``.
+
+    >>> float(compensated_sum([0.1] * 10, dtype=np.float32))
+    1.0000000149011612
+    """
+    acc = CompensatedSum(acc_dtype)
+    for chunk in iter_chunks(source, chunksize, dtype=dtype):
+        acc.add_chunk(chunk)
+    return acc.value
+
@@ -0,0 +1,12 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="session")
+def shifting_stream():
+    """Datos cuya dispersion crece despues de los primeros bloques: los
+    cuartiles de los primeros bloques no sirven para los bigotes finales."""
+    rng = np.random.default_rng(0)
+    stream = np.concatenate((rng.normal(0, 1, 20_000), rng.normal(0, 5, 200_000)))
+    stream.flags.writeable = False
+    return stream
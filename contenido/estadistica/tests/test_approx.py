@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from estadistica import approx_describe
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).normal(10.0, 2.0, size=200_000)
+
+
+def test_max_sample_is_respected(data):
+    table = approx_describe(data, rel_error=1e-6, max_sample=120_000, seed=0)
+    assert table.attrs["sample_size"] == 120_000
+    assert table.loc["count", "estimate"] == data.size
+
+
+def test_small_error_uses_all_data(data):
+    table = approx_describe(data, rel_error=1e-9, seed=0)
+    assert table.attrs["sample_size"] == data.size
+    assert table.loc["mean", "estimate"] == pytest.approx(data.mean())
+
+
+@pytest.mark.parametrize("make", [
+    lambda x: iter(np.array_split(x, 37)),
+    lambda x: (float(v) for v in x[:50_000]),
+    lambda x: np.array_split(x, 5),
+])
+def test_chunked_sources_are_sampled(data, make):
+    source = make(data)
+    table = approx_describe(source, rel_error=0.01, max_sample=40_000, seed=1)
+    assert table.attrs["sample_size"] <= 40_000
+    mean = table.loc["mean"]
+    assert mean["low"] <= 10.0 + 0.05 and mean["high"] >= 10.0 - 0.05
+    assert table.loc["50%", "estimate"] == pytest.approx(10.0, abs=0.1)
+
+
+def test_chunked_source_smaller_than_reservoir_is_exact(data):
+    x = data[:5000]
+    table = approx_describe(iter(np.array_split(x, 3)), seed=0)
+    assert table.attrs["sample_size"] == x.size
+    assert table.loc["count", "estimate"] == x.size
+    assert table.loc["mean", "estimate"] == pytest.approx(x.mean())
+    assert table.loc["max", "estimate"] == x.max()
+
+
+def test_strata_need_an_array(data):
+    with pytest.raises(ValueError, match="estratificado"):
+        approx_describe(iter([data]), strata=4)
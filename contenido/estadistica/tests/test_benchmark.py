@@ -0,0 +1,28 @@
+import json
+
+from estadistica import benchmark
+
+
+def test_large_sizes_skip_only_pure_python(monkeypatch):
+    monkeypatch.setattr(benchmark, "MAX_PYTHON", 50)
+    results = benchmark.run(sizes=[10, 100], dtypes=["float64"],
+                            layouts=["contiguous"], repeat=1)
+    names = {size: {r["name"] for r in results if r["size"] == size}
+             for size in (10, 100)}
+    assert names[10] == set(benchmark.IMPLEMENTATIONS)
+    assert names[100] == set(benchmark.IMPLEMENTATIONS) - benchmark.PURE_PYTHON
+    assert "pd.DataFrame.mean" in names[100]
+
+
+def test_compare_flags_regressions(tmp_path):
+    rows = [{"name": "np.mean", "size": 10, "dtype": "float64",
+             "layout": "contiguous", "peak_bytes": 0}]
+    base = {"results": [dict(rows[0], seconds=1.0)]}
+    new = {"results": [dict(rows[0], seconds=1.5)]}
+    paths = []
+    for i, report in enumerate((base, new)):
+        paths.append(str(tmp_path / "{}.json".format(i)))
+        with open(paths[-1], "w") as f:
+            json.dump(report, f)
+    assert bool(benchmark.compare(base, new)["regression"].iloc[0])
+    assert benchmark.main(["--compare"] + paths) == 1
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from estadistica import Bins, cut
+
+EDGES = [0, 1000, 2000, 3000, 4000, 5000, 6000]
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-500, 6500, size=5000).round(-2)
+    # Bordes exactos, fuera de rango y faltantes
+    x[:len(EDGES)] = EDGES
+    x[-3:] = np.nan
+    return x
+
+
+def _pandas_codes(x, **options):
+    codes = pd.cut(x, EDGES, **options).codes
+    return np.where(codes < 0, -1, codes)
+
+
+@pytest.mark.parametrize("options", [
+    {"closed": "right"},
+    {"closed": "right", "include_lowest": True},
+    {"closed": "left"},
+])
+def test_codes_match_pd_cut(data, options):
+    bins = Bins(EDGES, **options)
+    codes = cut(data, EDGES, **options).astype(np.int64)
+    codes[codes == bins.missing] = -1
+    expected = _pandas_codes(data, right=options["closed"] == "right",
+                             include_lowest=options.get("include_lowest", False))
+    np.testing.assert_array_equal(codes, expected)
+
+
+def test_value_counts_match_pd_cut(data):
+    expected = pd.Series(pd.cut(data, EDGES)).value_counts(sort=False).sort_index()
+    result = Bins(EDGES).value_counts(data)
+    np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+    assert result.index.equals(pd.IntervalIndex(expected.index.categories))
+
+
+def test_code_dtype_grows_with_bins():
+    assert cut([0.5], np.arange(11)).dtype == np.uint8
+    assert cut([0.5], np.arange(300)).dtype == np.uint16
+    assert Bins(np.arange(300)).missing == np.iinfo(np.uint16).max
+
+
+def test_from_intervals_and_invalid_edges():
+    intervals = pd.interval_range(0, 30, freq=10, closed="left")
+    bins = Bins.from_intervals(intervals)
+    assert bins.closed == "left"
+    np.testing.assert_array_equal(bins.edges, [0, 10, 20, 30])
+    with pytest.raises(ValueError):
+        Bins([0, 2, 1])
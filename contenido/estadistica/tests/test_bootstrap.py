@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from estadistica import bootstrap
+
+
+def test_degenerate_distribution_falls_back_to_percentile():
+    data = np.random.default_rng(0).integers(0, 3, 200)
+    with pytest.warns(RuntimeWarning, match="degenerada"):
+        result = bootstrap(data, "median", n_resamples=999, seed=0)
+    low, high = result.confidence_interval
+    assert np.isfinite(low) and np.isfinite(high)
+    assert low <= result.estimate <= high
+
+
+def test_workers_give_same_result():
+    x = np.random.default_rng(1).normal(size=2000)
+    options = dict(n_resamples=1000, seed=3, memory_budget=1 << 20)
+    serial = bootstrap(x, "median", workers=1, **options)
+    parallel = bootstrap(x, "median", workers=2, **options)
+    assert serial.confidence_interval == parallel.confidence_interval
+    np.testing.assert_array_equal(serial.distribution, parallel.distribution)
+
+
+@pytest.mark.parametrize("method", ["percentile", "BCa"])
+def test_mean_interval_close_to_scipy(method):
+    x = np.random.default_rng(2).exponential(size=300)
+    ours = bootstrap(x, "mean", n_resamples=9999, method=method, seed=0)
+    ref = stats.bootstrap((x,), np.mean, n_resamples=9999, method=method,
+                          random_state=0).confidence_interval
+    width = ref.high - ref.low
+    assert abs(ours.confidence_interval[0] - ref.low) < 0.05 * width
+    assert abs(ours.confidence_interval[1] - ref.high) < 0.05 * width
@@ -0,0 +1,51 @@
+import matplotlib
+import numpy as np
+import pandas as pd
+from matplotlib import cbook
+
+from estadistica import box_stats, boxplot, frame_box_stats, load_box_stats, save_box_stats
+from estadistica.boxplot import _SCALARS
+
+matplotlib.use("Agg")
+
+
+def test_exact_matches_matplotlib():
+    x = np.random.default_rng(0).standard_t(3, size=20_000)
+    ours = box_stats(x, max_fliers=100, seed=0)
+    ref = cbook.boxplot_stats(x)[0]
+    for key in _SCALARS:
+        np.testing.assert_allclose(ours[key], ref[key])
+    assert ours["n_fliers"] == len(ref["fliers"])
+    assert ours["fliers"].size == 100
+
+
+def test_chunked_second_pass_counts_final_fliers(shifting_stream):
+    x = shifting_stream
+    stats = box_stats(x, exact=False, chunksize=10_000, seed=0)
+    true = np.sum((x < stats["whislo"]) | (x > stats["whishi"]))
+    assert stats["n_fliers_exact"]
+    assert stats["n_fliers"] == true
+    fliers = stats["fliers"]
+    assert np.all((fliers < stats["whislo"]) | (fliers > stats["whishi"]))
+
+
+def test_chunked_single_pass_is_labelled_estimate(shifting_stream):
+    x = shifting_stream
+    stats = box_stats(iter(np.array_split(x, 22)), exact=False, seed=0)
+    assert not stats["n_fliers_exact"]
+    fliers = stats["fliers"]
+    assert np.all((fliers < stats["whislo"]) | (fliers > stats["whishi"]))
+
+
+def test_save_load_and_draw(tmp_path):
+    import matplotlib.pyplot as plt
+    frame = pd.DataFrame({"a": np.arange(100.0), "b": np.arange(100.0) ** 2})
+    stats = frame_box_stats(frame)
+    path = tmp_path / "stats.json"
+    save_box_stats(stats, path)
+    loaded = load_box_stats(path)
+    assert [s["label"] for s in loaded] == ["a", "b"]
+    fig, ax = plt.subplots()
+    artists = boxplot(loaded, ax=ax)
+    assert len(artists["boxes"]) == 2
+    plt.close(fig)
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from estadistica import CovarianceAccumulator, covariance
+
+
+@pytest.fixture
+def rows():
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=(3000, 7))
+    # Columnas correlacionadas y con medias grandes
+    return base @ rng.normal(size=(7, 7)) + 1e4
+
+
+@pytest.mark.parametrize("block", [2, 3, 7, 512])
+def test_blocked_matches_numpy(rows, block):
+    acc = covariance(rows, chunksize=250, block=block)
+    np.testing.assert_allclose(acc.cov(), np.cov(rows, rowvar=False), rtol=1e-10)
+    np.testing.assert_allclose(acc.corr(), np.corrcoef(rows, rowvar=False),
+                               rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(acc.cov(ddof=0), np.cov(rows, rowvar=False, ddof=0),
+                               rtol=1e-10)
+
+
+def test_merge_matches_single_pass(rows):
+    parts = [covariance(part, block=3) for part in np.array_split(rows, 4)]
+    merged = parts[0].merge(parts[1]).merge(parts[2]).merge(parts[3])
+    assert merged.count == rows.shape[0]
+    np.testing.assert_allclose(merged.mean, rows.mean(axis=0))
+    np.testing.assert_allclose(merged.cov(), np.cov(rows, rowvar=False), rtol=1e-10)
+    empty = CovarianceAccumulator()
+    np.testing.assert_allclose(empty.merge(merged).cov(), merged.cov())
+
+
+def test_frame_matches_pandas(rows):
+    frame = pd.DataFrame(rows, columns=list("abcdefg"))
+    acc = covariance(frame, chunksize=999, block=2)
+    pd.testing.assert_frame_equal(acc.cov(), frame.cov(), rtol=1e-10)
+    pd.testing.assert_frame_equal(acc.corr(), frame.corr(), rtol=1e-10)
+
+
+def test_constant_column_and_too_few_rows():
+    acc = covariance(np.array([[1.0, 2.0], [1.0, 3.0], [1.0, 5.0]]))
+    corr = acc.corr()
+    assert np.isnan(corr[0, 0]) and corr[1, 1] == 1.0
+    with pytest.raises(ValueError):
+        covariance(np.ones((1, 3))).cov()
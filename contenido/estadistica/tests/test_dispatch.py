@@ -0,0 +1,68 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from estadistica import dispatch
+
+
+def _numpy(stat, data, **kwargs):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return dispatch._IMPLEMENTATIONS[stat]["numpy"](np.asarray(data, dtype=float),
+                                                        **kwargs)
+
+
+@pytest.mark.parametrize("data", [[], [5.0], [1, 2, 3], [1, 2, 3, 4]])
+def test_python_backend_matches_numpy(data):
+    python = dispatch._IMPLEMENTATIONS
+    np.testing.assert_equal(python["mean"]["python"](data), _numpy("mean", data))
+    np.testing.assert_equal(python["var"]["python"](data, ddof=1),
+                            _numpy("var", data, ddof=1))
+    median = python["median"]["python"](data)
+    assert isinstance(median, float)
+    np.testing.assert_equal(median, _numpy("median", data))
+
+
+def _memmap(tmp_path, values):
+    path = tmp_path / "x.bin"
+    values.tofile(path)
+    return np.memmap(path, dtype=values.dtype, mode="r")
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 5000, 5001])
+def test_memmap_median_is_exact_in_chunks(tmp_path, monkeypatch, n):
+    # Limite pequeño para forzar varias pasadas de seleccion
+    monkeypatch.setattr(dispatch, "_SELECT_LIMIT", 100)
+    x = np.round(np.random.default_rng(n).normal(size=n), 2)
+    column = _memmap(tmp_path, x)
+    assert dispatch.choose_backend(column, "median") == "stream"
+    assert dispatch.median(column) == np.median(x)
+
+
+def test_memmap_median_constant_and_nan(tmp_path, monkeypatch):
+    monkeypatch.setattr(dispatch, "_SELECT_LIMIT", 10)
+    assert dispatch.median(_memmap(tmp_path, np.full(1000, 3.5))) == 3.5
+    x = np.arange(100.0)
+    x[50] = np.nan
+    assert np.isnan(dispatch.median(_memmap(tmp_path, x)))
+
+
+@pytest.mark.parametrize("values", [
+    [0.0] * 50 + [1.0] * 100 + [2.0] * 50,
+    [0.0] * 150 + [1.0] * 50,
+    [0.0] * 50 + [1.0] * 150,
+    [0.0] * 100 + [1.0] * 100,
+    [-1.0] * 60 + [1e-300] * 80 + [5e-324] * 61,
+])
+def test_memmap_median_with_many_duplicates(tmp_path, monkeypatch, values):
+    monkeypatch.setattr(dispatch, "_SELECT_LIMIT", 10)
+    x = np.array(values)
+    assert dispatch.median(_memmap(tmp_path, x)) == np.median(x)
+
+
+def test_object_arrays_use_python_backend():
+    from fractions import Fraction
+    x = np.array([Fraction(1, 3)] * 3, dtype=object)
+    assert dispatch.choose_backend(x, "mean") == "python"
+    assert dispatch.mean(x) == pytest.approx(1 / 3)
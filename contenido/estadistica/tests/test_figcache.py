@@ -0,0 +1,68 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from estadistica import FigureCache
+
+
+def test_large_arrays_differing_in_one_value(tmp_path):
+    cache = FigureCache(tmp_path)
+    a = np.arange(10_000.0)
+    b = a.copy()
+    b[5000] += 1
+    assert cache.key(a) != cache.key(b)
+    assert cache.key(a.tolist()) != cache.key(b.tolist())
+    assert cache.key({"x": a.tolist()}) != cache.key({"x": b.tolist()})
+
+
+def test_keys_are_stable_and_typed(tmp_path):
+    cache = FigureCache(tmp_path)
+    assert cache.key({"a": 1, "b": [2, 3]}) == cache.key({"b": [2, 3], "a": 1})
+    assert len({cache.key(1), cache.key("1"), cache.key(True), cache.key(1.0)}) == 4
+    assert cache.key(["ab"]) != cache.key(["a", "b"])
+
+
+def test_unhashable_argument_raises(tmp_path):
+    cache = FigureCache(tmp_path)
+    with pytest.raises(TypeError):
+        cache.key(object())
+    with pytest.raises(TypeError):
+        cache.key([1, {"x": object()}])
+
+
+def test_put_keeps_image_larger_than_limit(tmp_path):
+    cache = FigureCache(tmp_path, max_bytes=1)
+    fig, ax = plt.subplots()
+    ax.plot([1, 2, 3])
+    image = cache.put("k", fig)
+    plt.close(fig)
+    assert image.read().startswith(b"\x89PNG")
+
+
+def test_redefined_function_gets_new_key(tmp_path):
+    cache = FigureCache(tmp_path)
+    calls = []
+
+    def draw(values):
+        calls.append(1)
+        fig, ax = plt.subplots()
+        ax.plot(values)
+        return fig
+
+    first = cache.cached(draw)([1, 2])
+    assert cache.cached(draw)([1, 2]).path == first.path
+    assert len(calls) == 1
+
+    def draw(values):
+        calls.append(2)
+        fig, ax = plt.subplots()
+        ax.plot(values, "o")
+        return fig
+
+    second = cache.cached(draw)([1, 2])
+    assert second.path != first.path
+    assert calls == [1, 2]
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from estadistica import FrequencyTable
+
+
+def _expanded(table):
+    return np.repeat(table.values, table.counts)
+
+
+@pytest.mark.parametrize("values, counts", [
+    ([5], [10]),
+    ([0, 1, 2, 3, 9], [20, 72, 209, 527, 0]),
+    ([-3, 0, 0.5, 4], [0, 2, 1, 7]),
+])
+def test_histogram_matches_numpy_on_expanded_data(values, counts):
+    table = FrequencyTable(values, counts)
+    ours, edges = table.histogram(bins=4)
+    ref, ref_edges = np.histogram(_expanded(table), bins=4)
+    np.testing.assert_allclose(edges, ref_edges)
+    np.testing.assert_array_equal(ours, ref)
+
+
+def test_quantiles_and_moments_match_expanded_data():
+    table = FrequencyTable([0, 1, 2, 3], [20, 72, 209, 527])
+    x = _expanded(table)
+    np.testing.assert_allclose(table.quantile([0.1, 0.5, 0.9]),
+                               np.quantile(x, [0.1, 0.5, 0.9]))
+    np.testing.assert_allclose(table.mean(), x.mean())
+    np.testing.assert_allclose(table.var(ddof=1), x.var(ddof=1))
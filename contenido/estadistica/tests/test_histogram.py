@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from estadistica import AdaptiveHistogram, Histogram, histogram
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).gamma(2.0, 1000.0, size=20_001)
+
+
+@pytest.mark.parametrize("bins, range", [(5, None), (6, (0, 6000)), (1, None),
+                                         (np.array([0, 500, 2000, 9000.0]), None)])
+def test_matches_numpy(data, bins, range):
+    counts, edges = histogram(data, bins=bins, range=range, chunksize=1000)
+    expected, expected_edges = np.histogram(data, bins=bins, range=range)
+    np.testing.assert_array_equal(counts, expected)
+    np.testing.assert_allclose(edges, expected_edges)
+
+
+def test_chunk_list_and_constant_data(data):
+    chunks = np.array_split(data, 7)
+    np.testing.assert_array_equal(histogram(chunks, bins=5)[0],
+                                  np.histogram(data, bins=5)[0])
+    counts, edges = histogram([3.0] * 4, bins=2)
+    np.testing.assert_array_equal(counts, np.histogram([3.0] * 4, bins=2)[0])
+    np.testing.assert_allclose(edges, np.histogram([3.0] * 4, bins=2)[1])
+
+
+def test_one_shot_stream_needs_range(data):
+    with pytest.raises(ValueError, match="AdaptiveHistogram"):
+        histogram(iter(np.array_split(data, 4)), bins=5)
+    with pytest.raises(ValueError, match="range"):
+        histogram((float(v) for v in data), bins=5)
+    counts, _ = histogram(iter(np.array_split(data, 4)), bins=6, range=(0, 6000))
+    np.testing.assert_array_equal(counts, np.histogram(data, 6, (0, 6000))[0])
+
+
+def test_merge_matches_single_pass(data):
+    parts = [Histogram(bins=8, range=(0, 5000)).update(part)
+             for part in np.array_split(data, 3)]
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+    whole = Histogram(bins=8, range=(0, 5000)).update(data)
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+    assert merged.overflow == whole.overflow == np.sum(data > 5000)
+    with pytest.raises(ValueError):
+        whole.merge(Histogram(bins=4, range=(0, 5000)))
+
+
+def _cdf_error(hist, data):
+    # Fraccion de datos bajo cada borde interior comparada con la real
+    counts, edges = hist.to_numpy()
+    estimated = np.cumsum(counts)[:-1] / counts.sum()
+    actual = np.searchsorted(np.sort(data), edges[1:-1]) / data.size
+    return np.max(np.abs(estimated - actual))
+
+
+def test_adaptive_keeps_every_value_below_max_bins():
+    x = np.array([5.0, 1.0, 2.0, 1.0, 5.0, 1.0])
+    hist = AdaptiveHistogram(max_bins=8).update(x)
+    np.testing.assert_array_equal(hist.centers, np.sort(x))
+    np.testing.assert_array_equal(hist.counts, np.ones(x.size))
+
+
+def test_adaptive_merge_agrees_with_single_pass(data):
+    single = AdaptiveHistogram(64)
+    for chunk in np.array_split(data, 10):
+        single.update(chunk)
+    parts = [AdaptiveHistogram(64).update(part) for part in np.array_split(data, 4)]
+    merged = parts[0].merge(parts[1]).merge(parts[2]).merge(parts[3])
+    for hist in (single, merged):
+        assert hist.count == data.size
+        assert (hist.min, hist.max) == (data.min(), data.max())
+        assert hist.centers.size <= 64
+        assert _cdf_error(hist, data) < 0.02
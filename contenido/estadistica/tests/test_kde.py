@@ -0,0 +1,39 @@
+import warnings
+
+import numpy as np
+import pytest
+from scipy.stats import gaussian_kde
+
+from estadistica import bandwidth, kde
+
+
+def test_scott_matches_scipy():
+    x = np.random.default_rng(0).normal(size=2000)
+    grid, density = kde(x, gridsize=256)
+    np.testing.assert_allclose(density, gaussian_kde(x, "scott")(grid), atol=1e-4)
+
+
+def test_weighted_matches_scipy():
+    rng = np.random.default_rng(1)
+    x, w = rng.normal(size=1000), rng.uniform(size=1000)
+    grid, density = kde(x, weights=w, gridsize=256)
+    np.testing.assert_allclose(density, gaussian_kde(x, "scott", weights=w)(grid),
+                               atol=1e-4)
+
+
+def test_dpi_close_to_normal_reference():
+    x = np.random.default_rng(2).normal(size=100_000)
+    assert bandwidth(x, method="dpi") == pytest.approx(1.06 * 1e5 ** -0.2, rel=0.05)
+
+
+@pytest.mark.parametrize("bw", ["scott", "silverman", "dpi"])
+def test_constant_data_raises(bw):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(ValueError, match="ancho de banda"):
+            kde([1, 1, 1], bw=bw)
+
+
+def test_constant_data_with_numeric_bandwidth():
+    grid, density = kde([1, 1, 1], bw=0.5)
+    assert np.all(np.isfinite(density))
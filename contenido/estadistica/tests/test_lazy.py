@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from estadistica import Summary
+
+
+@pytest.mark.parametrize("values", [[1, 2, np.nan, 4, 5], [np.nan, 1.5, 2.5]])
+def test_describe_matches_pandas_with_missing_values(values):
+    expected = pd.Series(values, dtype=np.float64).describe()
+    result = Summary(values, chunksize=2).describe(exact=True).compute()
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+
+
+def test_mad_skips_missing_values():
+    x = [1.0, np.nan, 2.0, 6.0, np.inf]
+    result = Summary(x).mad().compute()
+    assert result["mad"] == pytest.approx(np.mean(np.abs(np.array([1, 2, 6]) - 3)))
@@ -0,0 +1,41 @@
+import numpy as np
+
+from estadistica import frequencies, mode, stream_mode
+
+
+def test_bincount_uint64_above_int64():
+    x = np.array([2**63 + 5, 2**63 + 5, 2**63 + 9], dtype=np.uint64)
+    values, counts = frequencies(x, strategy="bincount")
+    assert values.dtype == np.uint64
+    assert values.tolist() == [2**63 + 5, 2**63 + 9]
+    assert counts.tolist() == [2, 1]
+
+
+def test_bincount_small_signed_span():
+    values, counts = frequencies(np.array([-128, 127, 127], dtype=np.int8))
+    assert values.tolist() == [-128, 127]
+    assert counts.tolist() == [1, 2]
+
+
+def test_bincount_bool():
+    values, counts = frequencies(np.array([True, False, True]))
+    assert values.tolist() == [False, True]
+    assert counts.tolist() == [1, 2]
+
+
+def test_stream_mode_keeps_integer_dtype():
+    result = stream_mode(iter([1, 2, 2, 3]))
+    assert result.values.dtype.kind == "i"
+    assert result.values.tolist() == [2]
+
+
+def test_stream_mode_strings_are_chunked():
+    lines = ["GET /a", "GET /b", "GET /a"] * 1000
+    result = stream_mode(iter(lines), chunksize=256)
+    assert result.values.tolist() == ["GET /a"]
+    assert result.count == 2000
+
+
+def test_mode_matches_frequencies():
+    data = [90, 102, 110, 115, 85, 90, 100, 110, 110]
+    assert mode(data).values.tolist() == [110]
@@ -0,0 +1,38 @@
+import math
+
+import numpy as np
+import pytest
+
+from estadistica import Moments, moments
+
+
+def test_matches_numpy_across_chunks():
+    x = np.random.default_rng(0).normal(5, 2, size=10_001)
+    m = moments(x, chunksize=1000)
+    assert m.count == x.size
+    assert m.mean == pytest.approx(x.mean())
+    assert m.var(ddof=1) == pytest.approx(x.var(ddof=1))
+    assert (m.min, m.max) == (x.min(), x.max())
+
+
+@pytest.mark.parametrize("position", [0, 3, 6])
+def test_nan_propagates_like_numpy(position):
+    x = np.arange(7.0)
+    x[position] = np.nan
+    for m in (moments(x, chunksize=2),
+              moments(x.tolist(), chunksize=100),
+              Moments().merge(moments(x[:4])).merge(moments(x[4:]))):
+        assert math.isnan(m.mean) and math.isnan(m.var())
+        assert math.isnan(m.min) and math.isnan(m.max)
+    acc = Moments()
+    for value in x:
+        acc.add(value)
+    assert math.isnan(acc.min) and math.isnan(acc.max)
+
+
+@pytest.mark.parametrize("acc_dtype", [np.float64, "float64", np.dtype("float64"),
+                                       "float32"])
+def test_acc_dtype_accepts_dtype_specs(acc_dtype):
+    m = moments([1.0, 2.0, 3.0], acc_dtype=acc_dtype)
+    assert m.mean == 2.0
+    assert m.mean.dtype == np.dtype(acc_dtype)
@@ -0,0 +1,23 @@
+import numpy as np
+
+from estadistica import ExactQuantiles, OutlierDetector
+
+
+def test_fliers_lie_outside_final_whiskers(shifting_stream):
+    x = shifting_stream
+    detector = OutlierDetector(seed=0)
+    for start in range(0, x.size, 10_000):
+        detector.update(x[start:start + 10_000])
+    stats = detector.whisker_stats()
+    fliers = stats["fliers"]
+    assert fliers.size > 0
+    assert np.all((fliers < stats["whislo"]) | (fliers > stats["whishi"]))
+
+
+def test_single_chunk_matches_exact_fences():
+    x = np.random.default_rng(1).standard_t(3, size=5000)
+    detector = OutlierDetector(sketch=ExactQuantiles())
+    mask = detector.update(x)
+    q1, q3 = np.quantile(x, [0.25, 0.75])
+    lo, hi = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+    np.testing.assert_array_equal(mask, (x < lo) | (x > hi))
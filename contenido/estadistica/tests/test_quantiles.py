@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from estadistica import five_number, quantiles
+from estadistica.quantiles import _POSITIONS
+
+QS = [0.0, 0.01, 0.1, 0.25, 1 / 3, 0.5, 0.75, 0.9, 0.999, 1.0]
+
+
+@pytest.mark.parametrize("method", sorted(_POSITIONS))
+@pytest.mark.parametrize("n", [1, 2, 5, 100, 1001])
+def test_matches_numpy_for_every_method(method, n):
+    x = np.random.default_rng(n).normal(size=n)
+    result = quantiles(x, QS, method=method)
+    np.testing.assert_allclose(result.quantiles, np.quantile(x, QS, method=method),
+                               rtol=1e-12, atol=1e-12)
+    assert result.min == x.min() and result.max == x.max()
+
+
+@pytest.mark.parametrize("method", sorted(_POSITIONS))
+def test_integer_input(method):
+    x = np.random.default_rng(0).integers(-50, 50, size=37)
+    result = quantiles(x, QS, method=method)
+    np.testing.assert_allclose(result.quantiles, np.quantile(x, QS, method=method))
+    q1, q3 = np.quantile(x, [0.25, 0.75], method=method)
+    assert result.iqr == pytest.approx(q3 - q1)
+
+
+def test_shape_and_five_number():
+    x = np.arange(20.0)
+    assert quantiles(x, [[0.1, 0.2], [0.3, 0.4]]).quantiles.shape == (2, 2)
+    assert five_number(x) == tuple(np.quantile(x, [0, 0.25, 0.5, 0.75, 1])) + (9.5,)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        quantiles([], [0.5])
+    with pytest.raises(ValueError):
+        quantiles([1, 2], [1.5])
+    with pytest.raises(ValueError):
+        quantiles([1, 2], [0.5], method="inverted_cdf")
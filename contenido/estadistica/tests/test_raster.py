@@ -0,0 +1,40 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from estadistica import Raster, imshow, rasterize, shade
+
+
+def test_count_matches_histogram2d():
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=10_000), rng.normal(size=10_000)
+    raster = rasterize(x, y, width=20, height=10, chunksize=999)
+    expected, _, _ = np.histogram2d(y, x, bins=(10, 20),
+                                    range=((y.min(), y.max()), (x.min(), x.max())))
+    np.testing.assert_array_equal(raster.to_numpy(), expected)
+
+
+@pytest.mark.parametrize("agg", ["max", "min", "mean"])
+def test_zero_aggregate_is_not_transparent(agg):
+    raster = Raster(3, 1, (0, 3), (0, 1), agg=agg)
+    raster.update([0.5, 1.5], [0.5, 0.5], values=[0.0, 1.0])
+    rgba = shade(raster.to_numpy(), how="linear")
+    assert rgba[0, :, 3].tolist() == [255, 255, 0]
+
+
+def test_count_zero_is_transparent():
+    raster = Raster(3, 1, (0, 3), (0, 1)).update([0.5, 0.6], [0.5, 0.5])
+    assert shade(raster.to_numpy())[0, :, 3].tolist() == [255, 0, 0]
+
+
+def test_imshow_masks_empty_sum_pixels():
+    raster = Raster(3, 1, (0, 3), (0, 1), agg="sum")
+    raster.update([0.5, 1.5, 1.6], [0.5] * 3, values=[0.0, -1.0, 1.0])
+    fig, ax = plt.subplots()
+    image = imshow(raster, ax=ax)
+    plt.close(fig)
+    assert image.get_array()[0, :, 3].tolist() == [255, 255, 0]
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from estadistica import RollingWindow, rolling
+
+
+def test_nan_is_skipped_like_pandas():
+    x = [1, np.nan, 3, 4, 5]
+    result = rolling(x, 2, stats=("mean", "std", "min", "median"))
+    expected = pd.Series(x).rolling(2)
+    np.testing.assert_allclose(result["mean"], expected.mean())
+    np.testing.assert_allclose(result["std"], expected.std())
+    np.testing.assert_allclose(result["min"], expected.min())
+    np.testing.assert_allclose(result["median"], expected.median())
+
+
+def test_inf_is_skipped():
+    result = rolling([1, np.inf, 3, 4, 5], 2, stats=("mean", "max", "median"))
+    assert result.iloc[:3].isna().all().all()
+    assert result.iloc[4].tolist() == [4.5, 5.0, 4.5]
+
+
+@pytest.mark.parametrize("min_periods", [None, 3])
+def test_vectorized_matches_pandas(min_periods):
+    rng = np.random.default_rng(0)
+    x = rng.normal(1e3, 1, size=5000)
+    x[rng.integers(0, x.size, 50)] = np.nan
+    result = rolling(x, 100, stats=("mean", "var", "std", "min", "max", "range"),
+                     min_periods=min_periods)
+    expected = pd.Series(x).rolling(100, min_periods=min_periods)
+    np.testing.assert_allclose(result["mean"], expected.mean(), rtol=1e-12)
+    np.testing.assert_allclose(result["var"], expected.var(), rtol=1e-8)
+    np.testing.assert_allclose(result["min"], expected.min())
+    np.testing.assert_allclose(result["max"], expected.max())
+    np.testing.assert_allclose(result["range"], expected.max() - expected.min())
+
+
+def test_order_statistics_match_pandas():
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=2000)
+    x[::37] = np.nan
+    result = rolling(x, 50, stats=("median", "q1", "q3"), min_periods=10)
+    expected = pd.Series(x).rolling(50, min_periods=10)
+    np.testing.assert_allclose(result["median"], expected.median())
+    np.testing.assert_allclose(result["q1"], expected.quantile(0.25))
+    np.testing.assert_allclose(result["q3"], expected.quantile(0.75))
+
+
+def test_window_builds_only_requested_structures():
+    window = RollingWindow(3, stats=("mean",))
+    window.push(1.0).push(2.0)
+    assert window.mean == 1.5
+    with pytest.raises(ValueError):
+        window.min()
+    with pytest.raises(ValueError):
+        window.median()
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from estadistica import ExactQuantiles, KLLSketch
+
+QS = np.linspace(0, 1, 101)
+
+
+def _max_rank_error(sketch, data):
+    ranks = np.searchsorted(np.sort(data), sketch.quantile(QS)) / data.size
+    return np.max(np.abs(ranks - QS))
+
+
+@pytest.fixture(scope="module")
+def stream():
+    return np.random.default_rng(0).permutation(1_000_000).astype(np.float64)
+
+
+@pytest.mark.parametrize("n", [1, 7, 200])
+def test_exact_up_to_k(n):
+    x = np.random.default_rng(n).normal(size=n)
+    sketch = KLLSketch(k=200)
+    for chunk in np.array_split(x, 3):
+        sketch.update(chunk)
+    assert sketch.exact
+    np.testing.assert_array_equal(sketch.quantile(QS), np.quantile(x, QS))
+
+
+def test_compacts_past_k():
+    sketch = KLLSketch(k=200).update(np.arange(201.0))
+    assert not sketch.exact
+    assert sketch.five_number()[0] == 0.0 and sketch.five_number()[-1] == 200.0
+
+
+@pytest.mark.parametrize("k", [50, 200])
+def test_rank_error_on_large_stream(stream, k):
+    sketch = KLLSketch(k=k, seed=0)
+    for chunk in np.array_split(stream, 100):
+        sketch.update(chunk)
+    assert sketch.count == stream.size
+    assert _max_rank_error(sketch, stream) <= sketch.rank_error
+    assert (sketch.min, sketch.max) == (stream.min(), stream.max())
+    # La memoria no depende de n
+    assert sketch.nbytes() < 64 * k * 8
+
+
+def test_merge_within_rank_error(stream):
+    parts = [KLLSketch(k=200, seed=i).update(part)
+             for i, part in enumerate(np.array_split(stream, 8))]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged = merged.merge(part)
+    assert merged.count == stream.size
+    assert _max_rank_error(merged, stream) <= merged.rank_error
+
+
+def test_merge_of_small_sketches_is_exact():
+    a, b = np.arange(50.0), np.arange(50.0, 120.0)
+    merged = KLLSketch().update(a).merge(KLLSketch().update(b))
+    np.testing.assert_array_equal(merged.quantile(QS),
+                                  np.quantile(np.concatenate((a, b)), QS))
+
+
+@pytest.mark.parametrize("eps", [0.05, 0.01])
+def test_for_error(stream, eps):
+    sketch = KLLSketch.for_error(eps, seed=0)
+    assert sketch.rank_error <= eps
+    # k es el menor que cumple la cota
+    assert KLLSketch(sketch.k - 1).rank_error > eps
+    for chunk in np.array_split(stream, 10):
+        sketch.update(chunk)
+    assert _max_rank_error(sketch, stream) <= eps
+
+
+def test_empty_and_exact_reference():
+    assert np.isnan(KLLSketch().quantile(0.5))
+    assert np.isnan(ExactQuantiles().quantile(0.5))
+    x = np.random.default_rng(1).normal(size=1000)
+    exact = ExactQuantiles().update(x[:400]).merge(ExactQuantiles().update(x[400:]))
+    np.testing.assert_array_equal(exact.quantile(QS), np.quantile(x, QS))
+    assert exact.iqr() == pytest.approx(np.subtract(*np.quantile(x, [0.75, 0.25])))
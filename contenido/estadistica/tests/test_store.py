@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from estadistica import ColumnStore, moments
+
+
+def test_roundtrip_is_memmap(tmp_path):
+    store = ColumnStore(tmp_path)
+    store.write("x", np.arange(10, dtype=np.int32), chunksize=3)
+    column = ColumnStore(tmp_path)["x"]
+    assert isinstance(column, np.memmap)
+    assert column.dtype == np.int32
+    assert column.tolist() == list(range(10))
+    assert moments(column).mean == 4.5
+
+
+def test_lossy_later_chunk_is_rejected(tmp_path):
+    store = ColumnStore(tmp_path)
+    with pytest.raises(TypeError):
+        store.write("x", iter([np.array([1, 2]), np.array([1.5, 2.5])]))
+    assert "x" not in store
+    assert not list(tmp_path.glob("x.bin*"))
+
+
+def test_explicit_dtype_accepts_mixed_chunks(tmp_path):
+    store = ColumnStore(tmp_path)
+    store.write("x", iter([np.array([1, 2]), np.array([1.5, 2.5])]),
+                dtype=np.float64)
+    assert store["x"].tolist() == [1.0, 2.0, 1.5, 2.5]
+
+
+def test_safe_widening_is_allowed(tmp_path):
+    store = ColumnStore(tmp_path)
+    store.write("x", iter([np.array([1.5]), np.array([2], dtype=np.int32)]))
+    assert store["x"].tolist() == [1.5, 2.0]
+
+
+def test_invalid_names(tmp_path):
+    store = ColumnStore(tmp_path)
+    for name in ["", "..", "a/b"]:
+        with pytest.raises(ValueError):
+            store.write(name, [1, 2])
+
+
+def test_from_frame_rejects_object_columns(tmp_path):
+    frame = pd.DataFrame({"x": [1.0, 2.0], "name": ["a", "b"], "a/b": [1, 2]})
+    with pytest.raises(ValueError, match="name"):
+        ColumnStore.from_frame(tmp_path / "raise", frame)
+    store = ColumnStore.from_frame(tmp_path / "skip", frame, errors="skip")
+    assert store.columns == ["x"]
+
+
+@pytest.mark.parametrize("source, dtype", [
+    (np.empty(0, np.int16), np.int16),
+    (pd.Series([], dtype=np.uint8), np.uint8),
+    ([], np.float64),
+])
+def test_empty_source_keeps_its_dtype(tmp_path, source, dtype):
+    store = ColumnStore(tmp_path)
+    store.write("x", source)
+    column = ColumnStore(tmp_path)["x"]
+    assert column.dtype == dtype and column.size == 0
+
+
+def test_empty_object_array_is_rejected(tmp_path):
+    store = ColumnStore(tmp_path)
+    with pytest.raises(TypeError):
+        store.write("x", np.empty(0, dtype=object))
+    assert "x" not in store and not list(tmp_path.glob("x.bin*"))
@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from estadistica import ExactQuantiles, summarize
+
+
+@pytest.mark.parametrize("values", [
+    [1, 2, np.nan, 4, 5],
+    [np.nan, 1.5, 2.5, np.nan],
+    [np.nan, np.nan],
+])
+def test_describe_matches_pandas_with_missing_values(values):
+    expected = pd.Series(values, dtype=np.float64).describe()
+    result = summarize(values, chunksize=2, sketch=ExactQuantiles).describe()
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+
+
+def test_merge_matches_single_summary():
+    x = np.random.default_rng(0).normal(size=3000)
+    x[::7] = np.nan
+    whole = summarize(x, sketch=ExactQuantiles).describe()
+    parts = summarize(x[:1000], sketch=ExactQuantiles).merge(
+        summarize(x[1000:], sketch=ExactQuantiles)).describe()
+    pd.testing.assert_series_equal(parts, whole)
+    pd.testing.assert_series_equal(whole, pd.Series(x).describe(), check_names=False)
+
+
+def test_infinite_values_are_skipped():
+    result = summarize([1.0, np.inf, 3.0, -np.inf]).describe()
+    assert result["count"] == 2
+    assert (result["mean"], result["min"], result["max"]) == (2.0, 1.0, 3.0)
@@ -0,0 +1,29 @@
+import numpy as np
+
+from estadistica import Summary, compensated_sum, summarize, summarize_parallel
+
+
+def test_float32_storage_keeps_float64_accuracy():
+    x = np.random.default_rng(0).normal(100, 1, size=100_000).astype(np.float32)
+    exact = np.sum(x.astype(np.float64))
+    assert abs(compensated_sum(x, chunksize=1000) - exact) < 1e-6 * abs(exact)
+
+
+def test_summarize_parallel_accepts_dtypes():
+    rng = np.random.default_rng(1)
+    parts = [rng.normal(size=1000) for _ in range(3)]
+    result = summarize_parallel(parts, max_workers=2, dtype=np.float32,
+                                acc_dtype=np.float64)
+    serial = summarize(np.concatenate(parts), dtype=np.float32)
+    assert result.count == 3000
+    assert result.moments.dtype == np.float64
+    np.testing.assert_allclose(result.mean, serial.mean, rtol=1e-12)
+
+
+def test_lazy_summary_accepts_dtypes():
+    x = np.random.default_rng(2).normal(size=10_000)
+    result = Summary(x, dtype=np.float32, acc_dtype=np.float64).mean().mad().compute()
+    x32 = x.astype(np.float32).astype(np.float64)
+    np.testing.assert_allclose(result["mean"], x32.mean(), rtol=1e-12)
+    np.testing.assert_allclose(result["mad"], np.abs(x32 - x32.mean()).mean(),
+                               rtol=1e-12)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from scipy.stats import mstats
+
+from estadistica import trim_mean, winsorized_mean
+
+
+@pytest.fixture
+def matrix():
+    return np.random.default_rng(0).standard_t(2, size=(101, 6))
+
+
+@pytest.mark.parametrize("proportion", [0.0, 0.1, 0.25, 0.4])
+@pytest.mark.parametrize("axis", [0, 1, None])
+def test_trim_mean_matches_scipy(matrix, proportion, axis):
+    np.testing.assert_allclose(trim_mean(matrix, proportion, axis=axis),
+                               stats.trim_mean(matrix, proportion, axis=axis))
+
+
+def test_trim_mean_per_column_proportion(matrix):
+    proportions = [0.0, 0.1, 0.1, 0.2, 0.3, 0.45]
+    expected = [stats.trim_mean(matrix[:, j], p) for j, p in enumerate(proportions)]
+    np.testing.assert_allclose(trim_mean(matrix, proportions), expected)
+
+
+@pytest.mark.parametrize("limit", [0.0, 0.05, 0.2])
+def test_winsorized_mean_matches_scipy(matrix, limit):
+    expected = [mstats.winsorize(matrix[:, j], limits=limit).mean()
+                for j in range(matrix.shape[1])]
+    np.testing.assert_allclose(winsorized_mean(matrix, limit), expected)
+
+
+def test_frame_returns_series(matrix):
+    frame = pd.DataFrame(matrix, columns=list("abcdef"))
+    result = trim_mean(frame, 0.1)
+    assert list(result.index) == list("abcdef")
+    np.testing.assert_allclose(result, stats.trim_mean(matrix, 0.1))
+
+
+def test_proportion_too_large():
+    with pytest.raises(ValueError):
+        trim_mean([1, 2, 3, 4], 0.5)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from estadistica import (grouped_weighted_means, normalize_weights, weighted_gmean,
+                         weighted_hmean, weighted_mean)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.uniform(0.5, 10, size=(200, 3)), rng.uniform(0, 5, size=(200, 3))
+
+
+@pytest.mark.parametrize("axis", [0, 1, None])
+def test_match_numpy_and_scipy(data, axis):
+    x, w = data
+    np.testing.assert_allclose(weighted_mean(x, w, axis=axis),
+                               np.average(x, weights=w, axis=axis))
+    if axis is not None:
+        np.testing.assert_allclose(weighted_gmean(x, w, axis=axis),
+                                   stats.gmean(x, weights=w, axis=axis))
+        np.testing.assert_allclose(weighted_hmean(x, w, axis=axis),
+                                   stats.hmean(x, weights=w, axis=axis))
+
+
+def test_gmean_does_not_overflow():
+    x, w = np.full(1000, 1e300), np.full(1000, 3.0)
+    assert weighted_gmean(x, w) == pytest.approx(1e300)
+    assert weighted_gmean(np.full(1000, 1e-300), w) == pytest.approx(1e-300)
+
+
+def test_tiny_weights_are_rescaled():
+    assert weighted_mean([1.0, 3.0], [1e-320, 1e-320]) == 2.0
+
+
+def test_normalize_weights():
+    w = normalize_weights([[1, 3], [2, 2]], axis=1)
+    np.testing.assert_allclose(w, [[0.25, 0.75], [0.5, 0.5]])
+
+
+def test_grouped_matches_per_group(data):
+    x, w = data[0][:, 0], data[1][:, 0]
+    keys = np.random.default_rng(1).integers(0, 5, size=x.size)
+    result = grouped_weighted_means(x, w, keys)
+    assert list(result.index) == [0, 1, 2, 3, 4]
+    for key in range(5):
+        sel = keys == key
+        row = result.loc[key]
+        assert row["mean"] == pytest.approx(np.average(x[sel], weights=w[sel]))
+        assert row["gmean"] == pytest.approx(stats.gmean(x[sel], weights=w[sel]))
+        assert row["hmean"] == pytest.approx(stats.hmean(x[sel], weights=w[sel]))
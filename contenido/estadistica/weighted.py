@@ -0,0 +1,86 @@
+"""Medias ponderadas: aritmetica, geometrica y armonica.
+
+La media geometrica se calcula en escala logaritmica,
+
+    exp(sum(w_i * log(x_i)) / sum(w_i)),
+
+en lugar de multiplicar los ``x_i ** w_i``, cuyo producto se desborda (o
+se hace cero) con pocos cientos de datos. Los pesos se escalan por su
+maximo antes de sumar, lo cual no cambia el resultado.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def normalize_weights(weights, axis=None):
+    """Pesos normalizados w_i' = w_i / sum(w_i), que suman 1."""
+    w = np.asarray(weights, dtype=np.float64)
+    return w / w.sum(axis=axis, keepdims=True)
+
+
+def weighted_mean(x, weights, axis=None):
+    """Media ponderada sum(w_i * x_i) / sum(w_i).
+
+    >>> float(weighted_mean([4.0, 3.5, 5.0], [0.3, 0.3, 0.4]))
+    4.25
+    """
+    x, w = _prepare(x, weights)
+    return (_sum(w * x, axis) / _sum(w, axis))[()]
+
+
+def weighted_gmean(x, weights, axis=None):
+    """Media geometrica ponderada, calculada con logaritmos.
+
+    >>> round(float(weighted_gmean([1e300] * 1000, [1.0] * 1000)), -290)
+    1e+300
+    """
+    x, w = _prepare(x, weights)
+    with np.errstate(divide="ignore"):
+        logx = np.log(x)
+    return np.exp(_sum(w * logx, axis) / _sum(w, axis))[()]
+
+
+def weighted_hmean(x, weights, axis=None):
+    """Media armonica ponderada sum(w_i) / sum(w_i / x_i)."""
+    x, w = _prepare(x, weights)
+    with np.errstate(divide="ignore"):
+        return (_sum(w, axis) / _sum(w / x, axis))[()]
+
+
+def grouped_weighted_means(values, weights, keys):
+    """Medias ponderadas aritmetica, geometrica y armonica por grupo.
+
+    ``keys`` son las etiquetas de grupo de cada dato (por ejemplo, el
+    codigo del estudiante). Los grupos se codifican una sola vez y cada
+    suma se obtiene con ``np.bincount``; retorna un ``DataFrame`` indexado
+    por grupo con las columnas ``mean``, ``gmean`` y ``hmean``.
+    """
+    x, w = _prepare(values, weights)
+    codes, groups = pd.factorize(np.asarray(keys).reshape(-1), sort=True)
+    x, w = x.reshape(-1), np.broadcast_to(w, x.shape).reshape(-1)
+    size = len(groups)
+
+    def by_group(v):
+        return np.bincount(codes, weights=v, minlength=size)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sum_w = by_group(w)
+        mean = by_group(w * x) / sum_w
+        gmean = np.exp(by_group(w * np.log(x)) / sum_w)
+        hmean = sum_w / by_group(w / x)
+    return pd.DataFrame({"mean": mean, "gmean": gmean, "hmean": hmean},
+                        index=pd.Index(groups, name="group"))
+
+
+def _prepare(x, weights):
+    x = np.asarray(x, dtype=np.float64)
+    w = np.asarray(weights, dtype=np.float64)
+    scale = np.max(np.abs(w)) if w.size else 1.0
+    if scale > 0:
+        w = w / scale
+    return x, w
+
+
+def _sum(v, axis):
+    return np.asarray(np.sum(v, axis=axis))